@@ -424,10 +424,12 @@ func update_vision(image_base64: String, node_summary: Dictionary = {}) -> void:
 	var img := Image.new()
 	var err: Error = img.load_jpg_from_buffer(raw)
 	if err != OK:
-		# Try PNG as fallback
-		err = img.load_png_from_buffer(raw)
+		# Screenshots may also be WebP (format="webp"); PNG as last resort
+		err = img.load_webp_from_buffer(raw)
 		if err != OK:
-			return
+			err = img.load_png_from_buffer(raw)
+			if err != OK:
+				return
 
 	var tex := ImageTexture.create_from_image(img)
 	if _screenshot_rect:
@@ -14,6 +14,7 @@ func _ready() -> void:
 	register_route("GET", "/scene/tree", _routes_handler.handle_get_scene_tree)
 	register_route("POST", "/scene/create", _routes_handler.handle_create_scene)
 	register_route("POST", "/node/add", _routes_handler.handle_add_node)
+	register_route("POST", "/node/add_subtree", _routes_handler.handle_add_subtree)
 	register_route("POST", "/node/remove", _routes_handler.handle_remove_node)
 	register_route("POST", "/node/set_property", _routes_handler.handle_set_property)
 	register_route("GET", "/node/get_property", _routes_handler.handle_get_property)
@@ -73,6 +74,9 @@ func _ready() -> void:
 	# Editor screenshot
 	register_route("GET", "/screenshot", _routes_handler.handle_screenshot)
 
+	# Batched requests (several routed ops in one HTTP round trip)
+	register_route("POST", "/batch", handle_batch)
+
 	var err: Error = start(BridgeConfig.EDITOR_PORT)
 	if err == OK:
 		print("[Godot AI Bridge] Editor bridge listening on port %d" % BridgeConfig.EDITOR_PORT)
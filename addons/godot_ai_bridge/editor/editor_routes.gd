@@ -62,6 +62,21 @@ func handle_add_node(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	return result
 
 
+## POST /node/add_subtree
+func handle_add_subtree(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
+	var body: Dictionary = request.json_body if request.json_body is Dictionary else {}
+	var parent_path: String = str(body.get("parent_path", "."))
+	var tree: Variant = body.get("tree", null)
+
+	if not tree is Dictionary:
+		return {"error": "Must provide 'tree' as an object"}
+
+	var result: Dictionary = _SceneTools.add_subtree(parent_path, tree)
+	if result.has("ok"):
+		result["_description"] = "🌿 Added subtree '%s' (%d nodes) under '%s'" % [str(tree.get("name", "")), result.get("node_count", 0), parent_path]
+	return result
+
+
 ## POST /node/remove
 func handle_remove_node(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var body: Dictionary = request.json_body if request.json_body is Dictionary else {}
@@ -353,6 +368,7 @@ func handle_read_script(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var result: Dictionary = _ScriptTools.read_script(path)
 	if not result.has("error"):
 		var lines: int = result.get("content", "").count("\n") + 1
+		result["lines"] = lines
 		result["_description"] = "📄 Read '%s' (%d lines)" % [path, lines]
 	return result
 
@@ -371,6 +387,7 @@ func handle_write_script(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var result: Dictionary = _ScriptTools.write_script(path, content)
 	if result.has("ok"):
 		var lines: int = content.count("\n") + 1
+		result["lines"] = lines
 		result["_description"] = "✍️ Wrote '%s' (%d lines)" % [path, lines]
 	return result
 
@@ -412,10 +429,16 @@ func handle_debugger_output(_request: BridgeHTTPServer.BridgeRequest) -> Diction
 # --- Project Operations ---
 
 ## GET /project/structure
-func handle_project_structure(_request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
-	var result: Dictionary = _ProjectTools.get_structure()
+func handle_project_structure(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
+	var path: String = request.query_params.get("path", "res://")
+	var depth: int = int(request.query_params.get("depth", "5"))
+	if not path.begins_with("res://"):
+		return {"error": "'path' must be a res:// directory"}
+	if not DirAccess.dir_exists_absolute(path):
+		return {"error": "Directory not found: %s" % path}
+	var result: Dictionary = _ProjectTools.get_structure(path, maxi(depth, 1))
 	if not result.has("error"):
-		result["_description"] = "📁 Project structure"
+		result["_description"] = "📁 Project structure of %s" % path
 	return result
 
 
@@ -621,7 +644,8 @@ func handle_screenshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var height: int = int(request.query_params.get("height", str(BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT)))
 	var quality: float = float(request.query_params.get("quality", str(BridgeConfig.DEFAULT_SCREENSHOT_QUALITY)))
 	var mode: String = request.query_params.get("mode", "viewport")
-	var result: Dictionary = _EditorScreenshot.capture(width, height, mode, quality)
+	var format: String = request.query_params.get("format", "jpeg")
+	var result: Dictionary = _EditorScreenshot.capture(width, height, mode, quality, format)
 	if not result.has("error"):
 		var mode_label: String = "viewport" if mode == "viewport" else "full editor"
 		var size: Array = result.get("size", [width, height])
@@ -4,9 +4,9 @@ class_name EditorScreenshot
 extends RefCounted
 
 
-## Capture the editor and return as base64 JPEG.
+## Capture the editor and return as base64 JPEG (or WebP with format="webp").
 ## mode: "viewport" = just the 2D/3D main screen canvas, "full" = entire editor window.
-static func capture(width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, mode: String = "viewport", quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY) -> Dictionary:
+static func capture(width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, mode: String = "viewport", quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY, format: String = "jpeg") -> Dictionary:
 	var image: Image = null
 	var actual_mode: String = mode
 
@@ -28,7 +28,7 @@ static func capture(width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height:
 	if image == null:
 		return {"error": "Failed to capture editor screenshot — no available capture method"}
 
-	return _process_image(image, width, height, actual_mode, quality)
+	return _process_image(image, width, height, actual_mode, quality, format)
 
 
 ## Capture just the 2D/3D editor main screen canvas.
@@ -59,25 +59,32 @@ static func _capture_full() -> Image:
 	return null
 
 
-## Process a captured image: resize and encode to base64 JPEG with size budget.
-static func _process_image(image: Image, width: int, height: int, mode: String, quality: float) -> Dictionary:
+## Process a captured image: resize and encode to base64 JPEG/WebP with size budget.
+static func _process_image(image: Image, width: int, height: int, mode: String, quality: float, format: String) -> Dictionary:
 	if width > 0 and height > 0:
 		image.resize(width, height, Image.INTERPOLATE_LANCZOS)
 
-	var buffer: PackedByteArray = image.save_jpg_to_buffer(quality)
+	var buffer: PackedByteArray = _save_to_buffer(image, quality, format)
 	var base64: String = Marshalls.raw_to_base64(buffer)
 
 	# If over budget, re-encode at progressively lower quality
 	var q: float = quality - 0.15
 	while base64.length() > BridgeConfig.MAX_BASE64_LENGTH and q >= 0.2:
-		buffer = image.save_jpg_to_buffer(q)
+		buffer = _save_to_buffer(image, q, format)
 		base64 = Marshalls.raw_to_base64(buffer)
 		q -= 0.15
 
 	return {
 		"image": base64,
-		"mime": "image/jpeg",
+		"mime": "image/webp" if format == "webp" else "image/jpeg",
 		"size": [image.get_width(), image.get_height()],
 		"context": "editor",
 		"mode": mode,
 	}
+
+
+## Encode an image as lossy JPEG or WebP bytes at the given quality.
+static func _save_to_buffer(image: Image, quality: float, format: String) -> PackedByteArray:
+	if format == "webp":
+		return image.save_webp_to_buffer(true, quality)
+	return image.save_jpg_to_buffer(quality)
@@ -98,6 +98,75 @@ static func add_node(parent_path: String, node_type: String, node_name: String,
 	return {"ok": true, "path": str(root.get_path_to(new_node))}
 
 
+## Add a whole subtree of new nodes in one call.
+## tree: {"type": "Node2D", "name": "Enemy", "properties": {...}, "children": [<tree>, ...]}
+## The subtree is built detached and only attached once every node in it is
+## valid, so a bad spec leaves the scene untouched.
+static func add_subtree(parent_path: String, tree: Dictionary) -> Dictionary:
+	var root: Node = EditorInterface.get_edited_scene_root()
+	if root == null:
+		return {"error": "No scene is currently open"}
+
+	var parent: Node = root if parent_path == "." or parent_path == "" else root.get_node_or_null(parent_path)
+	if parent == null:
+		return {"error": "Parent node not found: %s" % parent_path}
+
+	var errors: Array[String] = []
+	var subtree_root: Node = _build_subtree(tree, errors)
+	if subtree_root == null:
+		return {"error": errors[0] if not errors.is_empty() else "Invalid subtree"}
+
+	parent.add_child(subtree_root)
+	var count: int = _own_subtree(subtree_root, root)
+	return {"ok": true, "path": str(root.get_path_to(subtree_root)), "node_count": count}
+
+
+## Build a detached node (and its children) from a subtree spec.
+## Returns null and appends to errors if any node in the spec is invalid.
+static func _build_subtree(spec: Dictionary, errors: Array[String]) -> Node:
+	var node_type: String = str(spec.get("type", ""))
+	var node_name: String = str(spec.get("name", ""))
+	if node_type == "" or node_name == "":
+		errors.append("Every subtree node needs 'type' and 'name'")
+		return null
+
+	var node: Node = _create_node_by_type(node_type)
+	if node == null:
+		errors.append("Unknown node type: %s" % node_type)
+		return null
+	node.name = node_name
+
+	var properties: Variant = spec.get("properties", {})
+	if properties is Dictionary:
+		for prop_name: String in properties:
+			_set_node_property(node, prop_name, properties[prop_name])
+
+	var children: Variant = spec.get("children", [])
+	if children is Array:
+		for child_spec: Variant in children:
+			if not child_spec is Dictionary:
+				errors.append("Malformed child spec under '%s'" % node_name)
+				node.free()
+				return null
+			var child: Node = _build_subtree(child_spec, errors)
+			if child == null:
+				node.free()
+				return null
+			node.add_child(child)
+
+	return node
+
+
+## Set owner on a node and all its descendants so they are saved with the scene.
+## Returns the number of nodes visited.
+static func _own_subtree(node: Node, scene_owner: Node) -> int:
+	node.owner = scene_owner
+	var count: int = 1
+	for child: Node in node.get_children():
+		count += _own_subtree(child, scene_owner)
+	return count
+
+
 ## Remove a node from the currently edited scene.
 static func remove_node(node_path: String) -> Dictionary:
 	var root: Node = EditorInterface.get_edited_scene_root()
@@ -350,24 +419,28 @@ static func find_nodes(name_pattern: String = "", type_name: String = "", group:
 		if search_root == null:
 			return {"error": "Search root not found: %s" % in_path}
 
+	# Decide the match mode and lowercase the needle once, not per node.
+	var is_glob: bool = name_pattern.contains("*")
+	var needle: String = name_pattern if is_glob else name_pattern.to_lower()
+
 	var results: Array = []
-	_find_nodes_recursive(search_root, root, name_pattern, type_name, group, results)
+	_find_nodes_recursive(search_root, root, needle, is_glob, type_name, group, results)
 
 	return {"matches": results, "count": results.size()}
 
 
 ## Recursively search for matching nodes.
-static func _find_nodes_recursive(node: Node, scene_root: Node, name_pattern: String, type_name: String, group: String, results: Array) -> void:
+static func _find_nodes_recursive(node: Node, scene_root: Node, name_pattern: String, is_glob: bool, type_name: String, group: String, results: Array) -> void:
 	if str(node.name).begins_with("@"):
 		return
 
 	var matches: bool = true
 
 	if name_pattern != "":
-		if name_pattern.contains("*"):
+		if is_glob:
 			matches = str(node.name).matchn(name_pattern)
 		else:
-			matches = str(node.name).to_lower().contains(name_pattern.to_lower())
+			matches = str(node.name).to_lower().contains(name_pattern)
 
 	if matches and type_name != "":
 		matches = node.is_class(type_name)
@@ -384,7 +457,7 @@ static func _find_nodes_recursive(node: Node, scene_root: Node, name_pattern: St
 		results.append(info)
 
 	for child: Node in node.get_children():
-		_find_nodes_recursive(child, scene_root, name_pattern, type_name, group, results)
+		_find_nodes_recursive(child, scene_root, name_pattern, is_glob, type_name, group, results)
 
 
 ## Recursively set owner on all children (so they save with the scene).
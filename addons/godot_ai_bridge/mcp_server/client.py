@@ -9,8 +9,46 @@ and may exceed the default 30s, so the ceiling must accommodate them.
 
 from __future__ import annotations
 
+import asyncio
+import json as _json
+from functools import lru_cache
+
 import httpx
-from typing import Any
+from typing import Any, Mapping, Sequence
+
+try:
+    import orjson
+except ImportError:  # optional speedup — pip install orjson
+    orjson = None
+
+# JSON codec for request bodies and responses. Scene trees and snapshots run
+# to tens of KB, and orjson parses and encodes them several times faster than
+# the stdlib; both produce plain dicts/lists, so callers can't tell them apart.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = _json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=256, typed=True)
+def pack_json(**fields: Any) -> bytes:
+    """Encode a small, flat request body, memoized on its field values.
+
+    For fixed-shape bodies like {"paused": true} that tools send over and
+    over; pass the bytes to GodotClient.post_raw(). typed=True keeps True
+    and 1 (or 1 and 1.0) from sharing a cache entry.
+    """
+    return _dumps(fields)
+
+# Query params may be a dict or a pre-built sequence of (key, value) pairs,
+# which httpx accepts as-is.
+QueryParams = Mapping[str, Any] | Sequence[tuple[str, Any]]
 
 # Hard ceiling — no single HTTP request to Godot should ever take longer than
 # this.  Individual callers can pass a *shorter* timeout but never a longer one.
@@ -18,19 +56,225 @@ from typing import Any
 # which compute timeout = user_duration + 15s headroom.
 MAX_TIMEOUT: float = 120.0
 
+# Connecting to a local bridge either succeeds or is refused almost
+# instantly; a connect that hangs means a wedged process, so don't let it
+# eat the (much longer) read budget.
+CONNECT_TIMEOUT: float = 2.0
+
+# Background aclose() tasks for discarded clients (see _reset_shared_client).
+_closing: set[asyncio.Task[None]] = set()
+
+# The bridges keep HTTP/1.1 connections alive, so pooled sockets are reused
+# across tool calls instead of paying a TCP handshake each time.
+_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+
+# One httpx.AsyncClient shared by the editor and runtime GodotClients, so both
+# bridges draw from a single connection pool and transport. Requests use
+# absolute URLs; each GodotClient only contributes its base URL and timeout.
+_shared: httpx.AsyncClient | None = None
+_shared_lock = asyncio.Lock()
+
+# Separate small pool for is_available() probes. godot_run_game polls the
+# runtime bridge many times while the game boots; keeping those probes on
+# their own kept-alive sockets means they never queue behind (or in front of)
+# real tool requests in the main pool, and no client is built per probe.
+_PROBE_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+_probe: httpx.AsyncClient | None = None
+
+
+def _get_probe_client() -> httpx.AsyncClient:
+    """Get or create the client used for availability probes."""
+    global _probe
+    if _probe is None or _probe.is_closed:
+        _probe = httpx.AsyncClient(timeout=2.0, limits=_PROBE_LIMITS)
+    return _probe
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide HTTP client."""
+    global _shared
+    if _shared is None or _shared.is_closed:
+        _shared = httpx.AsyncClient(timeout=30.0, limits=_LIMITS)
+    return _shared
+
+
+async def _reset_shared_client(stale: httpx.AsyncClient) -> None:
+    """Discard *stale* so the next request builds a fresh client.
+
+    Several requests can fail on the same stale pool at once; the lock and the
+    identity check make sure only the first of them swaps the client out.
+    The old client is closed in the background so the retry can connect
+    immediately instead of waiting for the stale pool to shut down.
+    """
+    global _shared
+    async with _shared_lock:
+        if _shared is not stale:
+            return
+        _shared = None
+    if not stale.is_closed:
+        task = asyncio.create_task(stale.aclose())
+        # Hold a reference until the close finishes so it isn't GC'd mid-flight
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+
+async def aclose() -> None:
+    """Close the shared clients and their pooled connections (server shutdown)."""
+    global _shared, _probe
+    clients = (_shared, _probe)
+    _shared = _probe = None
+    for client in clients:
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+def _decode(resp: httpx.Response) -> dict[str, Any]:
+    """Decode a bridge response, turning HTTP error statuses into an error dict.
+
+    Checking the status code directly avoids building an HTTPStatusError (and
+    its traceback) for replies the tools already handle via ``"error" in data``.
+    """
+    if resp.status_code >= 400:
+        # Prefer the bridge's own message ("Node not found: ..."), which is
+        # what the agent needs to see; fall back to the bare status.
+        try:
+            body = _loads(resp.content)
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and body.get("error"):
+            return {**body, "status": resp.status_code}
+        return {"error": f"HTTP {resp.status_code}", "body": resp.text}
+    return _loads(resp.content)
+
+
+class _PostBatcher:
+    """Coalesce POSTs issued within a short window into one ``/batch`` request.
+
+    Concurrent mutating tool calls (an agent firing add_node + set_property +
+    set_property in parallel) would otherwise cost one HTTP round trip each.
+    The bridge runs batched ops sequentially in arrival order and returns one
+    result per op, so every caller still gets exactly the response a direct
+    POST would have produced. Bridges without a ``/batch`` route (older plugin
+    versions) are detected on the first 404 and served with direct POSTs.
+    """
+
+    def __init__(
+        self, client: GodotClient, max_batch_size: int = 16, max_queue_time: float = 0.005,
+    ) -> None:
+        self._client = client
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._supported = True
+        # Hold references to in-flight flushes so they aren't GC'd mid-flight
+        self._flushing: set[asyncio.Task[None]] = set()
+
+    async def post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Queue a POST and wait for its slice of the batched response."""
+        if not self._supported:
+            return await self._client.post(path, json)
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append((path, json or {}, fut))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_queue_time, self._flush)
+        return await fut
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._pending = self._pending, []
+        if not items:
+            return
+        task = asyncio.create_task(self._send(items))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _send(
+        self, items: list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+    ) -> None:
+        try:
+            await self._send_batch(items)
+        except Exception as exc:
+            _fail_pending(items, exc)
+        finally:
+            # Never leave a caller waiting, whatever happened above
+            _fail_pending(items, RuntimeError("Batched request was not sent"))
+
+    async def _send_batch(
+        self, items: list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+    ) -> None:
+        if len(items) == 1 or not self._supported:
+            await self._send_each(items)
+            return
+        ops = [{"method": "POST", "path": path, "body": body} for path, body, _ in items]
+        try:
+            data = await self._client.post("/batch", {"ops": ops})
+        except Exception as exc:
+            _fail_pending(items, exc)
+            return
+        results = data.get("results")
+        if isinstance(results, list) and len(results) == len(items):
+            for (_, _, fut), result in zip(items, results):
+                if not fut.done():
+                    fut.set_result(result)
+            return
+        if data.get("status") == 404 or data.get("error") == "HTTP 404":
+            # No /batch route on this bridge — nothing ran, so send directly
+            self._supported = False
+            await self._send_each(items)
+            return
+        # Any other reply may have come after some ops already ran; resending
+        # them would apply those twice, so report the failure instead.
+        error = data.get("error") or "Malformed /batch response"
+        for _, _, fut in items:
+            if not fut.done():
+                fut.set_result({"error": error})
+
+    async def _send_each(
+        self, items: list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+    ) -> None:
+        """Fallback: send the queued POSTs one by one, preserving order."""
+        for path, body, fut in items:
+            if fut.done():
+                continue
+            try:
+                result = await self._client.post(path, body)
+            except Exception as exc:
+                if not fut.done():
+                    fut.set_exception(exc)
+            else:
+                if not fut.done():
+                    fut.set_result(result)
+
+
+def _fail_pending(
+    items: list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+    exc: BaseException,
+) -> None:
+    """Fail every still-unresolved future in a batch with *exc*."""
+    for _, _, fut in items:
+        if not fut.done():
+            fut.set_exception(exc)
+
 
 class GodotClient:
     """Async HTTP client for talking to one of the Godot bridge servers.
 
-    Uses a persistent httpx.AsyncClient to avoid creating a new TCP connection
-    for every single request. Falls back to a fresh client if the persistent
-    one encounters connection issues.
+    Requests go through the shared persistent httpx.AsyncClient to avoid
+    creating a new TCP connection for every single request. Falls back to a
+    fresh client if the persistent one encounters connection issues.
     """
 
     def __init__(self, host: str, port: int, timeout: float = 30.0) -> None:
         self.base_url = f"http://{host}:{port}"
         self.timeout = min(timeout, MAX_TIMEOUT)
-        self._client: httpx.AsyncClient | None = None
+        self._batcher: _PostBatcher | None = None
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[httpx.Response]] = {}
 
     def _effective_timeout(self, override: float | None) -> float:
         """Return the timeout to use, clamped to MAX_TIMEOUT."""
@@ -38,34 +282,70 @@ class GodotClient:
             return min(override, MAX_TIMEOUT)
         return self.timeout
 
-    def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the persistent HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-            )
-        return self._client
+    @staticmethod
+    def _timeout_config(t: float) -> httpx.Timeout:
+        """Full budget *t* for the request, capped at CONNECT_TIMEOUT to connect."""
+        return httpx.Timeout(t, connect=min(t, CONNECT_TIMEOUT))
 
     async def get(
-        self, path: str, params: dict[str, Any] | None = None, timeout: float | None = None,
+        self, path: str, params: QueryParams | None = None, timeout: float | None = None,
     ) -> dict[str, Any]:
         """Send a GET request and return the JSON response."""
+        return _decode(await self._send_get(path, params, timeout))
+
+    async def coalesced_get(self, path: str, params: QueryParams | None = None) -> dict[str, Any]:
+        """Like get(), but share one HTTP request among identical concurrent calls.
+
+        Parallel tool calls often ask for the same thing (two scene-tree reads
+        in one agent turn). While a GET for the same path and params is in
+        flight, later callers wait on it instead of sending their own. Each
+        caller still decodes the body itself, so nobody shares a mutable dict.
+        """
+        if params is None:
+            key: tuple[Any, ...] = (path,)
+        elif isinstance(params, Mapping):
+            key = (path, *sorted(params.items()))
+        else:
+            key = (path, *params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_get(path, params, None))
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda t: self._inflight.pop(key) if self._inflight.get(key) is t else None
+            )
+        # shield() so one caller being cancelled doesn't cancel the others
+        return _decode(await asyncio.shield(task))
+
+    def forget_inflight(self) -> None:
+        """Make later coalesced_get() calls send fresh requests.
+
+        Called after a mutation so a read issued afterwards doesn't join a GET
+        that was sent before it and may return the old state.
+        """
+        self._inflight.clear()
+
+    async def _send_get(
+        self, path: str, params: QueryParams | None, timeout: float | None,
+    ) -> httpx.Response:
         t = self._effective_timeout(timeout)
+        url = self.base_url + path
+        client = _get_shared_client()
+        tc = self._timeout_config(t)
         try:
-            client = self._get_client()
-            resp = await client.get(path, params=params, timeout=t)
-            resp.raise_for_status()
-            return resp.json()
-        except (httpx.ConnectError, httpx.ReadError, httpx.WriteError):
-            # Connection pool might be stale — retry once with a fresh client
-            await self._reset_client()
-            client = self._get_client()
-            resp = await client.get(path, params=params, timeout=t)
-            resp.raise_for_status()
-            return resp.json()
+            return await client.get(url, params=params, timeout=tc)
+        except (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError):
+            # Connection pool might be stale (e.g. the bridge dropped an idle
+            # keep-alive socket) — retry once with a fresh client. A refused
+            # connection (ConnectError) is not retried: it means the bridge is
+            # down, and rebuilding the shared client would only throw away
+            # the other bridge's kept-alive sockets.
+            await _reset_shared_client(client)
+            return await _get_shared_client().get(url, params=params, timeout=tc)
+        except httpx.ConnectTimeout as e:
+            raise httpx.ConnectError(f"Could not connect to Godot at {self.base_url}") from e
         except httpx.TimeoutException:
-            await self._reset_client()
+            await _reset_shared_client(client)
             raise httpx.TimeoutException(
                 f"Godot did not respond within {t}s on GET {path} — "
                 f"the editor/game may have crashed or is unresponsive"
@@ -75,41 +355,63 @@ class GodotClient:
         self, path: str, json: dict[str, Any] | None = None, timeout: float | None = None,
     ) -> dict[str, Any]:
         """Send a POST request with a JSON body and return the JSON response."""
+        return await self.post_raw(path, _dumps(json or {}), timeout=timeout)
+
+    async def post_raw(
+        self, path: str, content: bytes, timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Send a POST with an already-encoded JSON body (see pack_json)."""
         t = self._effective_timeout(timeout)
+        url = self.base_url + path
+        client = _get_shared_client()
+        tc = self._timeout_config(t)
         try:
-            client = self._get_client()
-            resp = await client.post(path, json=json or {}, timeout=t)
-            resp.raise_for_status()
-            return resp.json()
-        except (httpx.ConnectError, httpx.ReadError, httpx.WriteError):
-            await self._reset_client()
-            client = self._get_client()
-            resp = await client.post(path, json=json or {}, timeout=t)
-            resp.raise_for_status()
-            return resp.json()
+            resp = await client.post(url, content=content, headers=_JSON_HEADERS, timeout=tc)
+            return _decode(resp)
+        except (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError):
+            await _reset_shared_client(client)
+            resp = await _get_shared_client().post(url, content=content, headers=_JSON_HEADERS, timeout=tc)
+            return _decode(resp)
+        except httpx.ConnectTimeout as e:
+            raise httpx.ConnectError(f"Could not connect to Godot at {self.base_url}") from e
         except httpx.TimeoutException:
-            await self._reset_client()
+            await _reset_shared_client(client)
             raise httpx.TimeoutException(
                 f"Godot did not respond within {t}s on POST {path} — "
                 f"the editor/game may have crashed or is unresponsive"
             )
 
-    async def is_available(self) -> bool:
-        """Check if this bridge server is reachable."""
+    async def batched_post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        """POST via the request batcher (see _PostBatcher).
+
+        Only for mutating calls whose ordering relative to each other is all
+        that matters; reads should use get()/post() directly.
+        """
+        if self._batcher is None:
+            self._batcher = _PostBatcher(self)
+        return await self._batcher.post(path, json)
+
+    async def is_available(self, timeout: float | None = None) -> bool:
+        """Check if this bridge server is reachable.
+
+        A probe that takes longer than *timeout* seconds (default: the probe
+        client's 2s) counts as unavailable, so a hung process can't stall
+        the caller.
+        """
+        url = self.base_url + "/info"
+        client = _get_probe_client()
+        t = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
         try:
-            async with httpx.AsyncClient(base_url=self.base_url, timeout=2.0) as client:
-                resp = await client.get("/info")
-                resp.raise_for_status()
-            return True
+            try:
+                resp = await client.get(url, timeout=t)
+            except (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError):
+                # A kept-alive probe socket from a previous game session;
+                # httpx has dropped it, so one retry gets a fresh connection.
+                resp = await client.get(url, timeout=t)
+            return resp.status_code < 400
         except Exception:
             return False
 
-    async def _reset_client(self) -> None:
-        """Close and discard the current client so a fresh one is created."""
-        if self._client is not None and not self._client.is_closed:
-            await self._client.aclose()
-        self._client = None
-
 
 # Pre-configured client instances
 editor = GodotClient("127.0.0.1", 9899)
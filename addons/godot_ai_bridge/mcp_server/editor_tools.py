@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
+import uuid
 from typing import Any
 
 from fastmcp import FastMCP
 from client import editor, runtime
-from utils import b64_image as _b64_image, is_error_line as _is_error_line
+from runtime_tools import reset_runtime_state
+from utils import b64_image as _b64_image, extract_error_lines as _extract_error_lines
 
 
 # ---------------------------------------------------------------------------
@@ -44,12 +47,13 @@ _SCRIPT_ERROR_RE = re.compile(
 )
 
 
+# The fatal patterns as one case-insensitive alternation (see utils.ERROR_RE).
+_FATAL_RE = re.compile("|".join(re.escape(p) for p in _FATAL_PATTERNS), re.IGNORECASE)
+
+
 def _is_fatal_error(line: str) -> bool:
     """Return True if *line* matches any fatal startup error pattern."""
-    lowered = line.strip().lower()
-    if not lowered:
-        return False
-    return any(p in lowered for p in _FATAL_PATTERNS)
+    return _FATAL_RE.search(line) is not None
 
 
 def _parse_error_line(line: str) -> dict[str, Any]:
@@ -99,6 +103,112 @@ def _truncate_log_tail(output: str, max_lines: int = 60) -> str:
     return output.strip()
 
 
+def _count_files_in_tree(entries: list) -> int:
+    """Count files in a project structure tree.
+
+    Walks with an explicit stack so deep trees don't pay a Python frame
+    per directory or hit the recursion limit.
+    """
+    count = 0
+    stack = [entries]
+    while stack:
+        for entry in stack.pop():
+            entry_type = entry.get("type")
+            if entry_type == "file":
+                count += 1
+            elif entry_type == "directory":
+                stack.append(entry.get("children", ()))
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Read-only result cache
+# ---------------------------------------------------------------------------
+
+# Agents re-read the scene tree, project layout, file searches and input map
+# between edits. Those only change when a mutating tool runs (every one of
+# which goes through _post/_batched_post and clears the cache) or when the
+# developer edits something by hand in the editor, which the short TTL covers.
+_RO_CACHE_TTL: float = 3.0
+_ro_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+# Bumped by every mutating call. A read captures it before fetching and only
+# caches its result if no mutation finished in the meantime; otherwise it
+# could store a pre-mutation answer after the cache was already cleared.
+_ro_cache_gen: int = 0
+
+
+def _ro_cache_get(key: str) -> dict[str, Any] | None:
+    """Return a cached read-only result if it is still fresh."""
+    entry = _ro_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > _RO_CACHE_TTL:
+        return None
+    return entry[1]
+
+
+def _ro_cache_generation() -> int:
+    """Return the current cache generation, to pass to _ro_cache_put()."""
+    return _ro_cache_gen
+
+
+def _ro_cache_put(key: str, result: dict[str, Any], gen: int) -> None:
+    """Cache a successful read-only result fetched at generation *gen*."""
+    if "error" not in result and gen == _ro_cache_gen:
+        _ro_cache[key] = (time.monotonic(), result)
+
+
+def _ro_cache_invalidate() -> None:
+    """Drop cached results and make reads already in flight skip caching."""
+    global _ro_cache_gen
+    _ro_cache_gen += 1
+    _ro_cache.clear()
+    editor.forget_inflight()
+
+
+async def _post(path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+    """POST a mutating editor call and drop cached read-only results."""
+    try:
+        return await editor.post(path, json)
+    finally:
+        _ro_cache_invalidate()
+
+
+async def _batched_post(path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Like _post(), but through the editor request batcher."""
+    try:
+        return await editor.batched_post(path, json)
+    finally:
+        _ro_cache_invalidate()
+
+
+# Last godot_is_game_running result. Agents poll it in tight loops; the run
+# state can't meaningfully change within this window, and run/stop reset it
+# so their own transitions are seen immediately.
+_run_state: dict[str, Any] = {"at": 0.0, "result": None}
+_RUN_STATE_TTL = 0.2  # seconds
+
+# Background launches started with godot_run_game(wait=False), by job id.
+_run_jobs: dict[str, asyncio.Task[dict[str, Any]]] = {}
+# When each finished job completed. Finished jobs nobody polls are dropped
+# once they are older than _RUN_JOB_MAX_AGE or beyond the newest
+# _RUN_JOB_MAX_DONE, so abandoned launches don't pile up.
+_run_jobs_done: dict[str, float] = {}
+_RUN_JOB_MAX_AGE = 600.0  # seconds
+_RUN_JOB_MAX_DONE = 16
+
+
+def _on_run_job_done(job_id: str, task: asyncio.Task[dict[str, Any]]) -> None:
+    """Done-callback for background launches: retrieve the outcome and prune."""
+    if not task.cancelled():
+        task.exception()  # marks it retrieved; godot_poll_run re-reads it
+    now = time.monotonic()
+    _run_jobs_done[job_id] = now
+    finished = sorted(_run_jobs_done.items(), key=lambda item: item[1])
+    for i, (old_id, done_at) in enumerate(finished):
+        if now - done_at > _RUN_JOB_MAX_AGE or i < len(finished) - _RUN_JOB_MAX_DONE:
+            _run_jobs_done.pop(old_id, None)
+            _run_jobs.pop(old_id, None)
+
+
 def register_editor_tools(mcp: FastMCP) -> None:
     """Register all editor tools with the MCP server."""
 
@@ -111,8 +221,12 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Returns a nested structure with each node's name, type, path, and children.
         Use this to understand the scene structure before making modifications.
         """
+        cached = _ro_cache_get("/scene/tree")
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
         try:
-            data = await editor.get("/scene/tree")
+            data = await editor.coalesced_get("/scene/tree")
         except Exception as e:
             return {"error": f"Editor not reachable: {e}. Is the Godot editor open with the AI Bridge plugin enabled?"}
         if "error" in data:
@@ -120,6 +234,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         if "_description" not in data:
             root = data.get("root", {})
             data["_description"] = f"🌳 Scene tree of '{root.get('name', '?')}' ({root.get('type', '?')})"
+        _ro_cache_put("/scene/tree", data, gen)
         return data
 
     @mcp.tool
@@ -130,7 +245,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             root_type: The Godot node class for the root (e.g., 'Node2D', 'Control', 'Node3D').
             save_path: Where to save the scene (e.g., 'res://scenes/level_2.tscn').
         """
-        result = await editor.post("/scene/create", {"root_type": root_type, "save_path": save_path})
+        result = await _post("/scene/create", {"root_type": root_type, "save_path": save_path})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🆕 Created scene '{save_path}' (root: {root_type})"
         return result
@@ -155,11 +270,32 @@ def register_editor_tools(mcp: FastMCP) -> None:
         body: dict[str, Any] = {"parent_path": parent_path, "type": type, "name": name}
         if properties:
             body["properties"] = properties
-        result = await editor.post("/node/add", body)
+        result = await _batched_post("/node/add", body)
         if "ok" in result and "_description" not in result:
             result["_description"] = f"➕ Added {type} '{name}' under '{parent_path}'"
         return result
 
+    @mcp.tool
+    async def godot_add_subtree(parent_path: str, tree: dict[str, Any]) -> dict[str, Any]:
+        """Add a whole subtree of new nodes in one call.
+
+        Use this instead of a chain of godot_add_node/godot_set_property calls when
+        building something with several nodes (e.g., a character with sprite and
+        collision shape). Nothing is added if any node in the tree is invalid.
+
+        Args:
+            parent_path: Path to the parent node ('.' for scene root).
+            tree: Nested node spec — {"type": "CharacterBody2D", "name": "Enemy",
+                  "properties": {"position": [100, 200]},
+                  "children": [{"type": "Sprite2D", "name": "Sprite"}, ...]}.
+                  properties and children are optional at every level.
+        """
+        result = await _batched_post("/node/add_subtree", {"parent_path": parent_path, "tree": tree})
+        if "ok" in result and "_description" not in result:
+            count = result.get("node_count", "?")
+            result["_description"] = f"🌿 Added subtree '{tree.get('name', '?')}' ({count} nodes) under '{parent_path}'"
+        return result
+
     @mcp.tool
     async def godot_remove_node(path: str) -> dict[str, Any]:
         """Remove a node from the currently edited scene.
@@ -167,7 +303,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Args:
             path: Path to the node relative to scene root (e.g., 'Player/OldChild').
         """
-        result = await editor.post("/node/remove", {"path": path})
+        result = await _batched_post("/node/remove", {"path": path})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🗑️ Removed node '{path}'"
         return result
@@ -183,7 +319,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
                    Use dicts for colors: {"r": 1, "g": 0, "b": 0, "a": 1}.
                    Use strings for resource paths: "res://textures/sprite.png".
         """
-        result = await editor.post("/node/set_property", {"path": path, "property": property, "value": value})
+        result = await _batched_post("/node/set_property", {"path": path, "property": property, "value": value})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"✏️ Set '{path}'.{property}"
         return result
@@ -196,7 +332,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             path: Node path relative to scene root.
             property: Property name to read.
         """
-        result = await editor.get("/node/get_property", {"path": path, "property": property})
+        result = await editor.coalesced_get("/node/get_property", {"path": path, "property": property})
         if "error" not in result and "_description" not in result:
             result["_description"] = f"🔍 '{path}'.{property} = {result.get('value', '?')}"
         return result
@@ -204,7 +340,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
     @mcp.tool
     async def godot_save_scene() -> dict[str, Any]:
         """Save the currently edited scene to disk."""
-        result = await editor.post("/scene/save")
+        result = await _post("/scene/save")
         if "ok" in result and "_description" not in result:
             result["_description"] = "💾 Scene saved"
         return result
@@ -216,7 +352,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Args:
             path: Resource path to the scene (e.g., 'res://scenes/main.tscn').
         """
-        result = await editor.post("/scene/open", {"path": path})
+        result = await _post("/scene/open", {"path": path})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"📂 Opened scene '{path}'"
         return result
@@ -235,7 +371,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         body: dict[str, Any] = {"path": path}
         if new_name:
             body["new_name"] = new_name
-        result = await editor.post("/node/duplicate", body)
+        result = await _batched_post("/node/duplicate", body)
         if "ok" in result and "_description" not in result:
             result["_description"] = f"📋 Duplicated '{path}' → '{result.get('name', '?')}'"
         return result
@@ -253,7 +389,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             new_parent: Path to the new parent ('.' for scene root, 'NewParent' for a child).
             keep_global_transform: If True, adjusts local transform to maintain global position.
         """
-        result = await editor.post("/node/reparent", {
+        result = await _batched_post("/node/reparent", {
             "path": path,
             "new_parent": new_parent,
             "keep_global_transform": keep_global_transform,
@@ -278,7 +414,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
                       or one of: 'up' (one step earlier), 'down' (one step later),
                       'first' (move to front), 'last' (move to back).
         """
-        result = await editor.post("/node/reorder", {
+        result = await _post("/node/reorder", {
             "path": path,
             "position": position,
         })
@@ -297,7 +433,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Args:
             path: Node path ('.' for root, 'Player', 'UI/Score', etc.).
         """
-        result = await editor.get("/node/properties", {"path": path})
+        result = await editor.coalesced_get("/node/properties", {"path": path})
         if "error" not in result and "_description" not in result:
             result["_description"] = f"📜 {result.get('count', '?')} properties on '{result.get('node', path)}' ({result.get('type', '?')})"
         return result
@@ -310,7 +446,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             path: Path to the node to rename (e.g., 'Player', 'UI/OldLabel').
             new_name: The new name for the node.
         """
-        result = await editor.post("/node/rename", {"path": path, "new_name": new_name})
+        result = await _batched_post("/node/rename", {"path": path, "new_name": new_name})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"✏️ Renamed '{result.get('old_name', path)}' → '{new_name}'"
         return result
@@ -335,7 +471,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         body: dict[str, Any] = {"scene_path": scene_path, "parent_path": parent_path}
         if name:
             body["name"] = name
-        result = await editor.post("/node/instance_scene", body)
+        result = await _post("/node/instance_scene", body)
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🔗 Instanced '{scene_path}' as '{result.get('name', '?')}' under '{parent_path}'"
         return result
@@ -369,7 +505,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             params["group"] = group
         if in_path:
             params["in"] = in_path
-        result = await editor.get("/node/find", params)
+        result = await editor.coalesced_get("/node/find", params)
         if "error" not in result and "_description" not in result:
             count = result.get("count", 0)
             criteria = " + ".join(filter(None, [
@@ -417,7 +553,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             target: Node path of the receiver (e.g., '.', 'GameManager').
             method: Method name on the target to call (e.g., '_on_start_pressed').
         """
-        result = await editor.post("/node/connect_signal", {
+        result = await _post("/node/connect_signal", {
             "source": source,
             "signal": signal_name,
             "target": target,
@@ -442,7 +578,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             target: Node path of the receiver.
             method: Method name on the target that was connected.
         """
-        result = await editor.post("/node/disconnect_signal", {
+        result = await _post("/node/disconnect_signal", {
             "source": source,
             "signal": signal_name,
             "target": target,
@@ -465,7 +601,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             path: Node path (e.g., 'Player', 'Enemies/Goblin').
             group: Group name to add the node to (e.g., 'enemies', 'persistent').
         """
-        result = await editor.post("/node/add_to_group", {"path": path, "group": group})
+        result = await _post("/node/add_to_group", {"path": path, "group": group})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🏷️ Added '{path}' to group '{group}'"
         return result
@@ -478,7 +614,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             path: Node path (e.g., 'Player', 'Enemies/Goblin').
             group: Group name to remove the node from.
         """
-        result = await editor.post("/node/remove_from_group", {"path": path, "group": group})
+        result = await _post("/node/remove_from_group", {"path": path, "group": group})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🏷️ Removed '{path}' from group '{group}'"
         return result
@@ -499,7 +635,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             action: Action name (e.g., 'jump', 'attack', 'move_left').
             deadzone: Analog deadzone threshold (0.0–1.0, default 0.5).
         """
-        result = await editor.post("/project/input_map/add_action", {
+        result = await _post("/project/input_map/add_action", {
             "action": action,
             "deadzone": deadzone,
         })
@@ -514,7 +650,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Args:
             action: Action name to remove (e.g., 'jump', 'attack').
         """
-        result = await editor.post("/project/input_map/remove_action", {"action": action})
+        result = await _post("/project/input_map/remove_action", {"action": action})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🎮 Removed input action '{action}'"
         return result
@@ -539,7 +675,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
                    - joypad_button: Button index as string ('0', '1', '2', etc.).
                    - joypad_motion: 'axis:direction' like '0:1' (left stick right) or '1:-1' (left stick up).
         """
-        result = await editor.post("/project/input_map/add_binding", {
+        result = await _post("/project/input_map/add_binding", {
             "action": action,
             "event_type": event_type,
             "value": value,
@@ -558,7 +694,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             action: Action name (e.g., 'jump').
             index: 0-based index of the binding to remove.
         """
-        result = await editor.post("/project/input_map/remove_binding", {
+        result = await _post("/project/input_map/remove_binding", {
             "action": action,
             "index": index,
         })
@@ -577,7 +713,8 @@ def register_editor_tools(mcp: FastMCP) -> None:
         """
         result = await editor.get("/script/read", {"path": path})
         if "error" not in result and "_description" not in result:
-            lines = result.get("content", "").count("\n") + 1
+            # Newer bridges report the line count; only scan on older ones
+            lines = result.get("lines") or result.get("content", "").count("\n") + 1
             result["_description"] = f"📄 Read '{path}' ({lines} lines)"
         return result
 
@@ -591,9 +728,9 @@ def register_editor_tools(mcp: FastMCP) -> None:
             path: Resource path for the script (e.g., 'res://scripts/player.gd').
             content: Full script content to write.
         """
-        result = await editor.post("/script/write", {"path": path, "content": content})
+        result = await _post("/script/write", {"path": path, "content": content})
         if "ok" in result and "_description" not in result:
-            lines = content.count("\n") + 1
+            lines = result.get("lines") or content.count("\n") + 1
             result["_description"] = f"✍️ Wrote '{path}' ({lines} lines)"
         return result
 
@@ -610,7 +747,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             extends: Base class (e.g., 'CharacterBody2D', 'Node2D', 'Control').
             template: Template type — 'basic' (ready+process), 'empty' (just extends), or 'full' (type-specific).
         """
-        result = await editor.post("/script/create", {"path": path, "extends": extends, "template": template})
+        result = await _post("/script/create", {"path": path, "extends": extends, "template": template})
         if "ok" in result and "_description" not in result:
             result["_description"] = f"🆕 Created script '{path}' (extends {extends})"
         return result
@@ -621,7 +758,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
 
         Returns a list of errors with file paths and messages.
         """
-        result = await editor.get("/script/errors")
+        result = await editor.coalesced_get("/script/errors")
         if "_description" not in result:
             errors = result.get("errors", [])
             if errors:
@@ -640,27 +777,31 @@ def register_editor_tools(mcp: FastMCP) -> None:
 
     # --- Project Tools ---
 
-    def _count_files_in_tree(entries: list) -> int:
-        """Recursively count files in a project structure tree."""
-        count = 0
-        for entry in entries:
-            if entry.get("type") == "file":
-                count += 1
-            elif entry.get("type") == "directory":
-                count += _count_files_in_tree(entry.get("children", []))
-        return count
-
     @mcp.tool
-    async def godot_project_structure() -> dict[str, Any]:
-        """Get the project directory tree (res://).
+    async def godot_project_structure(path: str = "res://", depth: int = 5) -> dict[str, Any]:
+        """Get the project directory tree (res:// or a subdirectory of it).
 
         Returns file names, types, paths, and sizes. Excludes .godot/ and the bridge addon.
         Use this to understand what files exist before reading or modifying them.
+        On large projects, start shallow and drill into the directories you need.
+
+        Args:
+            path: Directory to list (e.g., 'res://scripts'). Defaults to the project root.
+            depth: How many directory levels to descend (default 5, minimum 1).
         """
-        result = await editor.get("/project/structure")
-        if "error" not in result and "_description" not in result:
+        return await _read_structure(path, depth)
+
+    async def _read_structure(path: str, depth: int) -> dict[str, Any]:
+        key = f"/project/structure?{path}&{depth}"
+        cached = _ro_cache_get(key)
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
+        result = await editor.coalesced_get("/project/structure", {"path": path, "depth": depth})
+        if "error" not in result:
             file_count = _count_files_in_tree(result.get("tree", []))
-            result["_description"] = f"📁 Project structure — {file_count} files"
+            result["_description"] = f"📁 Project structure of {path} — {file_count} files"
+        _ro_cache_put(key, result, gen)
         return result
 
     @mcp.tool
@@ -671,16 +812,22 @@ def register_editor_tools(mcp: FastMCP) -> None:
             pattern: Glob pattern like '*.gd', '*.tscn', 'player*'. Leave empty to use query instead.
             query: Substring to search for in filenames (case-insensitive). Leave empty to use pattern.
         """
+        key = f"/project/search?{pattern}&{query}"
+        cached = _ro_cache_get(key)
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
         params: dict[str, str] = {}
         if pattern:
             params["pattern"] = pattern
         if query:
             params["query"] = query
-        result = await editor.get("/project/search", params)
+        result = await editor.coalesced_get("/project/search", params)
         if "error" not in result and "_description" not in result:
             matches = len(result.get("matches", []))
             term = pattern or query
             result["_description"] = f"🔎 Search '{term}' — {matches} match(es)"
+        _ro_cache_put(key, result, gen)
         return result
 
     @mcp.tool
@@ -690,130 +837,161 @@ def register_editor_tools(mcp: FastMCP) -> None:
         Returns action names mapped to their input events (keys, mouse buttons, joypad).
         Use this to understand what input actions are available for game_trigger_action.
         """
-        result = await editor.get("/project/input_map")
+        return await _read_input_map()
+
+    async def _read_input_map() -> dict[str, Any]:
+        cached = _ro_cache_get("/project/input_map")
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
+        result = await editor.coalesced_get("/project/input_map")
         if "error" not in result and "_description" not in result:
             count = len(result.get("actions", {}))
             result["_description"] = f"🎮 Input map — {count} action(s)"
+        _ro_cache_put("/project/input_map", result, gen)
         return result
 
     @mcp.tool
     async def godot_get_project_settings() -> dict[str, Any]:
         """Get key project settings: name, main scene, window size, physics FPS, etc."""
-        result = await editor.get("/project/settings")
+        return await _read_settings()
+
+    async def _read_settings() -> dict[str, Any]:
+        cached = _ro_cache_get("/project/settings")
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
+        result = await editor.coalesced_get("/project/settings")
         if "_description" not in result:
             name = result.get("name", "?")
             result["_description"] = f"⚙️ Project settings for '{name}'"
+        _ro_cache_put("/project/settings", result, gen)
         return result
 
     @mcp.tool
     async def godot_get_autoloads() -> dict[str, Any]:
         """Get all registered autoload singletons and their script paths."""
-        result = await editor.get("/project/autoloads")
+        return await _read_autoloads()
+
+    async def _read_autoloads() -> dict[str, Any]:
+        cached = _ro_cache_get("/project/autoloads")
+        if cached is not None:
+            return cached
+        gen = _ro_cache_generation()
+        result = await editor.coalesced_get("/project/autoloads")
         if "error" not in result and "_description" not in result:
             count = len(result.get("autoloads", {}))
             result["_description"] = f"🔌 {count} autoload(s)"
+        _ro_cache_put("/project/autoloads", result, gen)
         return result
 
-    # --- Run Control ---
-
     @mcp.tool
-    async def godot_run_game(scene: str = "", strict: bool = False) -> dict[str, Any]:
-        """Start running the game from the editor.
-
-        After starting, runtime tools become available. This tool will wait for
-        the runtime bridge to become reachable before returning.
-
-        When **strict=True** (startup gating mode), any fatal runtime error
-        detected during startup causes the tool to return ``ok=false`` with
-        machine-readable ``startup_errors``.  Fatal patterns include:
-        Node not found, Cannot call method, Invalid access/call, SCRIPT ERROR,
-        and Parse Error.
+    async def godot_project_overview(depth: int = 2) -> dict[str, Any]:
+        """Get project settings, autoloads, input map and directory tree in one call.
 
-        If you receive ``ok=false``, you MUST enter repair mode:
-        1. Stop normal actions (no snapshot/click).
-        2. Call ``godot_get_errors()`` and ``godot_get_debugger_output()`` for
-           full diagnostics.
-        3. Patch the files referenced by ``startup_errors`` / debug output.
-        4. Save the scene (``godot_save_scene()``), then re-run
-           ``godot_run_game(strict=True)``.
-        5. Repeat up to 5 attempts. Only proceed when ``ok=true``.
+        Use this at the start of a session instead of calling the four project
+        tools one after another; the requests are issued concurrently.
 
         Args:
-            scene: Optional scene path to run (e.g., 'res://scenes/level_1.tscn').
-                   If empty, runs the project's main scene.
-            strict: If True, treat any fatal error pattern as a startup failure
-                    that must be repaired before the agent may proceed.
+            depth: Directory levels for the structure part (default 2).
         """
+        try:
+            settings, autoloads, input_map, structure = await asyncio.gather(
+                _read_settings(),
+                _read_autoloads(),
+                _read_input_map(),
+                _read_structure("res://", depth),
+            )
+        except Exception as e:
+            return {"error": f"Editor not reachable: {e}. Is the Godot editor open with the AI Bridge plugin enabled?"}
+        result: dict[str, Any] = {
+            "settings": settings,
+            "autoloads": autoloads,
+            "input_map": input_map,
+            "structure": structure,
+        }
+        name = settings.get("name", "?")
+        file_count = _count_files_in_tree(structure.get("tree", []))
+        actions = len(input_map.get("actions", {}))
+        result["_description"] = (
+            f"🗂️ Project '{name}' — {file_count} files (depth {depth}), "
+            f"{len(autoloads.get('autoloads', {}))} autoload(s), {actions} action(s)"
+        )
+        return result
+
+    # --- Run Control ---
+
+    async def _launch_game(scene: str, strict: bool) -> dict[str, Any]:
+        """Start the game and wait for the runtime bridge (see godot_run_game)."""
+        _run_state["result"] = None
+        reset_runtime_state()
         body: dict[str, Any] = {}
         if scene:
             body["scene"] = scene
 
-        result = await editor.post("/game/run", body)
-
-        # Give the editor a moment to process the deferred play call and
-        # compile/launch the game before we start polling the runtime bridge.
-        await asyncio.sleep(1.5)
-
-        # Poll until runtime bridge is available (~15 more seconds of polling).
-        # Large projects can take a while to boot, so we give plenty of time
-        # before declaring "game failed to start".
-        for i in range(60):  # ~15 more seconds of polling (60 × 0.25s)
-            await asyncio.sleep(0.25)
-            if await runtime.is_available():
-                info = await runtime.get("/info")
-                scene_name = info.get("current_scene", scene or "main scene")
-
-                # Gather console output for error detection
-                console_output = ""
-                try:
-                    console = await runtime.get("/console")
-                    console_output = console.get("output", "")
-                except Exception:
-                    pass  # Console fetch is best-effort
-
-                # Gather debugger output as well (captures errors the console may miss)
-                debugger_output = ""
-                try:
-                    debugger = await editor.get("/debugger/output")
-                    debugger_output = debugger.get("output", "")
-                except Exception:
-                    pass
-
-                combined_output = (console_output + "\n" + debugger_output).strip()
-
-                # --- Strict mode: check for fatal startup errors ---
-                if strict:
-                    startup_errors = _collect_startup_errors(combined_output)
-                    if startup_errors:
-                        return {
-                            "ok": False,
-                            "running": True,
-                            "error_type": "startup_runtime_error",
-                            "startup_errors": startup_errors,
-                            "log_tail": _truncate_log_tail(combined_output),
-                            "_description": (
-                                f"❌ Game started but has {len(startup_errors)} fatal "
-                                f"startup error(s) — read the errors below, fix the "
-                                f"code, stop, save, and relaunch"
-                            ),
-                        }
-
-                # --- Build success response ---
-                response: dict[str, Any] = {
-                    "ok": True,
-                    "running": True,
-                    "_description": f"▶️ Game started — '{scene_name}'",
-                    "game_info": info,
-                }
-                # Surface any non-fatal error lines in non-strict mode
-                if console_output:
-                    error_lines = [
-                        line.strip() for line in console_output.split("\n")
-                        if _is_error_line(line)
-                    ]
-                    if error_lines:
-                        response["runtime_errors"] = error_lines
-                return response
+        result = await _post("/game/run", body)
+
+        # Poll until the runtime bridge is available. Probing starts right
+        # away with exponential backoff (25ms → 400ms), so a fast boot is
+        # caught almost immediately while large projects that take a while
+        # still get the full ~16.5s before we declare "game failed to start".
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 16.5
+        delay = 0.025
+        while loop.time() < deadline:
+            # Short probe timeout: a half-started game that accepts the
+            # connection but never answers mustn't eat the whole deadline.
+            if await runtime.is_available(timeout=0.5):
+                # Game info, console output (for error detection) and the
+                # editor's debugger output (captures errors the console may
+                # miss) are independent — fetch them concurrently.
+                info, console, debugger = await asyncio.gather(
+                    runtime.get("/info"),
+                    runtime.get("/console"),
+                    editor.get("/debugger/output"),
+                    return_exceptions=True,
+                )
+                # If /info failed the bridge isn't fully up yet; keep polling.
+                if not isinstance(info, BaseException):
+                    scene_name = info.get("current_scene", scene or "main scene")
+                    # Console and debugger output are best-effort
+                    console_output = "" if isinstance(console, BaseException) else console.get("output", "")
+                    debugger_output = "" if isinstance(debugger, BaseException) else debugger.get("output", "")
+
+                    combined_output = (console_output + "\n" + debugger_output).strip()
+
+                    # --- Strict mode: check for fatal startup errors ---
+                    if strict:
+                        startup_errors = _collect_startup_errors(combined_output)
+                        if startup_errors:
+                            return {
+                                "ok": False,
+                                "running": True,
+                                "error_type": "startup_runtime_error",
+                                "startup_errors": startup_errors,
+                                "log_tail": _truncate_log_tail(combined_output),
+                                "_description": (
+                                    f"❌ Game started but has {len(startup_errors)} fatal "
+                                    f"startup error(s) — read the errors below, fix the "
+                                    f"code, stop, save, and relaunch"
+                                ),
+                            }
+
+                    # --- Build success response ---
+                    response: dict[str, Any] = {
+                        "ok": True,
+                        "running": True,
+                        "_description": f"▶️ Game started — '{scene_name}'",
+                        "game_info": info,
+                    }
+                    # Surface any non-fatal error lines in non-strict mode
+                    if console_output:
+                        error_lines = _extract_error_lines(console_output)
+                        if error_lines:
+                            response["runtime_errors"] = error_lines
+                    return response
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, 0.4)
 
         # Runtime bridge never connected — the game likely crashed on startup.
         # Gather whatever diagnostics we can from the editor side.
@@ -829,10 +1007,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
             # If no structured errors were found, synthesize one from any
             # available error lines so the caller always gets something useful.
             if not startup_errors:
-                error_lines = [
-                    line.strip() for line in debugger_output.split("\n")
-                    if _is_error_line(line)
-                ]
+                error_lines = _extract_error_lines(debugger_output)
                 startup_errors = [_parse_error_line(l) for l in error_lines]
             return {
                 "ok": False,
@@ -853,14 +1028,87 @@ def register_editor_tools(mcp: FastMCP) -> None:
             "_description": "❌ Game failed to start — call godot_get_debugger_output() to see errors, fix, and relaunch",
         }
         if debugger_output:
-            error_lines = [
-                line.strip() for line in debugger_output.split("\n")
-                if _is_error_line(line)
-            ]
+            error_lines = _extract_error_lines(debugger_output)
             if error_lines:
                 response["debugger_errors"] = error_lines
         return response
 
+    @mcp.tool
+    async def godot_run_game(
+        scene: str = "", strict: bool = False, wait: bool = True,
+    ) -> dict[str, Any]:
+        """Start running the game from the editor.
+
+        After starting, runtime tools become available. This tool will wait for
+        the runtime bridge to become reachable before returning.
+
+        When **strict=True** (startup gating mode), any fatal runtime error
+        detected during startup causes the tool to return ``ok=false`` with
+        machine-readable ``startup_errors``.  Fatal patterns include:
+        Node not found, Cannot call method, Invalid access/call, SCRIPT ERROR,
+        and Parse Error.
+
+        If you receive ``ok=false``, you MUST enter repair mode:
+        1. Stop normal actions (no snapshot/click).
+        2. Call ``godot_get_errors()`` and ``godot_get_debugger_output()`` for
+           full diagnostics.
+        3. Patch the files referenced by ``startup_errors`` / debug output.
+        4. Save the scene (``godot_save_scene()``), then re-run
+           ``godot_run_game(strict=True)``.
+        5. Repeat up to 5 attempts. Only proceed when ``ok=true``.
+
+        Args:
+            scene: Optional scene path to run (e.g., 'res://scenes/level_1.tscn').
+                   If empty, runs the project's main scene.
+            strict: If True, treat any fatal error pattern as a startup failure
+                    that must be repaired before the agent may proceed.
+            wait: If True (default), block until the game is up (or has failed)
+                  and return the full launch result. If False, return a
+                  ``job_id`` immediately and keep booting in the background;
+                  call ``godot_poll_run(job_id)`` for the result. Use this to
+                  keep working with other editor tools while a large project
+                  starts.
+        """
+        if wait:
+            return await _launch_game(scene, strict)
+        job_id = uuid.uuid4().hex[:8]
+        task = asyncio.create_task(_launch_game(scene, strict))
+        task.add_done_callback(lambda t: _on_run_job_done(job_id, t))
+        _run_jobs[job_id] = task
+        return {
+            "job_id": job_id,
+            "status": "pending",
+            "_description": f"🚀 Launching game in the background — poll with godot_poll_run('{job_id}')",
+        }
+
+    @mcp.tool
+    async def godot_poll_run(job_id: str) -> dict[str, Any]:
+        """Get the result of a background launch started with godot_run_game(wait=False).
+
+        Returns ``status="pending"`` while the game is still booting. Once done,
+        returns the same result godot_run_game would have (``ok``, ``running``,
+        ``startup_errors``, ...) with ``status="done"``; the job is then forgotten.
+
+        Args:
+            job_id: The job_id returned by godot_run_game(wait=False).
+        """
+        task = _run_jobs.get(job_id)
+        if task is None:
+            return {"error": f"Unknown job_id '{job_id}' — it may already have been collected"}
+        if not task.done():
+            return {"job_id": job_id, "status": "pending", "_description": "⏳ Game is still starting"}
+        del _run_jobs[job_id]
+        _run_jobs_done.pop(job_id, None)
+        if task.cancelled():
+            return {"job_id": job_id, "status": "done", "error": "Launch was cancelled"}
+        try:
+            result = task.result()
+        except Exception as e:
+            return {"job_id": job_id, "status": "done", "error": f"Launch failed: {e}"}
+        result["job_id"] = job_id
+        result["status"] = "done"
+        return result
+
     @mcp.tool
     async def godot_stop_game() -> dict[str, Any]:
         """Stop the currently running game.
@@ -868,7 +1116,9 @@ def register_editor_tools(mcp: FastMCP) -> None:
         After stopping, runtime tools will no longer be available.
         Use this before editing code — changes require a restart to take effect.
         """
-        result = await editor.post("/game/stop")
+        _run_state["result"] = None
+        reset_runtime_state()
+        result = await _post("/game/stop")
         if "_description" not in result:
             result["_description"] = "⏹️ Game stopped"
         return result
@@ -876,10 +1126,16 @@ def register_editor_tools(mcp: FastMCP) -> None:
     @mcp.tool
     async def godot_is_game_running() -> dict[str, Any]:
         """Check if the game is currently running."""
+        now = time.monotonic()
+        if _run_state["result"] is not None and now - _run_state["at"] < _RUN_STATE_TTL:
+            return _run_state["result"]
         result = await editor.get("/game/is_running")
         if "_description" not in result:
             running = result.get("running", False)
             result["_description"] = "🟢 Game is running" if running else "⚫ Game is not running"
+        if "error" not in result:
+            _run_state["at"] = now
+            _run_state["result"] = result
         return result
 
     # --- Editor Screenshot ---
@@ -890,6 +1146,7 @@ def register_editor_tools(mcp: FastMCP) -> None:
         width: int = 640,
         height: int = 360,
         quality: float = 0.75,
+        format: str = "jpeg",
     ) -> list[Any]:
         """Capture a screenshot of the Godot editor.
 
@@ -905,12 +1162,15 @@ def register_editor_tools(mcp: FastMCP) -> None:
             width: Screenshot width in pixels (default 640).
             height: Screenshot height in pixels (default 360).
             quality: JPEG quality 0.0–1.0 (default 0.75). Lower = smaller response.
+            format: "jpeg" (default) or "webp". WebP is usually noticeably smaller
+                at the same quality.
         """
         data = await editor.get("/screenshot", {
-            "width": str(width),
-            "height": str(height),
-            "quality": str(quality),
+            "width": width,
+            "height": height,
+            "quality": quality,
             "mode": mode,
+            "format": format,
         })
         if "error" in data:
             return [data["error"]]
@@ -919,5 +1179,5 @@ def register_editor_tools(mcp: FastMCP) -> None:
         mode_label = "viewport" if actual_mode == "viewport" else "full editor"
         return [
             f"📸 Editor screenshot — {mode_label} ({data['size'][0]}x{data['size'][1]})",
-            _b64_image(data["image"]),
+            _b64_image(data["image"], data.get("mime", "image/jpeg")),
         ]
@@ -7,16 +7,34 @@ Only available when the game is running.
 
 from __future__ import annotations
 
-import time
+import asyncio
+import os
+from functools import lru_cache
+
+import httpx
 from typing import Any
 
 from fastmcp import FastMCP
-from client import editor, runtime
-from utils import b64_image as _b64_image, is_error_line as _is_error_line
+from client import QueryParams, editor, pack_json, runtime
+from utils import b64_image as _b64_image, extract_error_lines as _extract_error_lines
 
 
 GAME_NOT_RUNNING_MSG = "Game is not running. Use godot_run_game() to start it first."
 
+# Pre-built query params for game_events, which agents call in tight loops.
+_EVENTS_PEEK: tuple[tuple[str, str], ...] = (("peek", "true"),)
+_EVENTS_NOPEEK: tuple[tuple[str, str], ...] = ()
+
+# Set GAB_MCP_DESCRIBE=0 to skip building client-side _description strings
+# for tools driven in tight loops (the bridge's own description, if any, is
+# passed through untouched).
+_DESCRIBE = os.environ.get("GAB_MCP_DESCRIBE", "1") != "0"
+
+# Description templates for the high-frequency polling tools, filled with a
+# single str.format() call per invocation.
+_EVENTS_DESC = "📨 {} game event(s){}"
+_DIFF_DESC = "📊 Snapshot diff — {} added, {} removed, {} changed"
+
 
 async def _push_vision(image_b64: str, snapshot_data: dict[str, Any] | None = None) -> None:
     """Push a game screenshot to the editor bridge for live display in the activity panel.
@@ -32,7 +50,7 @@ async def _push_vision(image_b64: str, snapshot_data: dict[str, Any] | None = No
             vp_h = vp_size[1] if isinstance(vp_size, (list, tuple)) and len(vp_size) >= 2 else 0
             body["summary"] = {
                 "scene": snapshot_data.get("scene_name", ""),
-                "node_count": _count_nodes(snapshot_data.get("nodes", [])),
+                "node_count": _snapshot_node_count(snapshot_data),
                 "fps": snapshot_data.get("fps", "?"),
                 "paused": snapshot_data.get("paused", False),
                 "frame": snapshot_data.get("frame", "?"),
@@ -76,10 +94,19 @@ def _format_director_notes(directives: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-# Cache runtime availability to avoid a full HTTP round-trip on every tool call.
-# After a successful check, we trust the runtime is up for a short window.
-_runtime_cache: dict[str, float] = {"last_ok": 0.0}
-_CACHE_TTL = 2.0  # seconds
+# Whether the runtime bridge has answered since it last went away. Lets a
+# refused connection be reported as a crash (with diagnostics) when the game
+# was up, and as "not running" when it was never started.
+_runtime_state: dict[str, bool] = {"seen": False}
+
+
+def reset_runtime_state() -> None:
+    """Forget that the runtime bridge was up.
+
+    Called by godot_run_game/godot_stop_game so a game stopped on purpose
+    isn't reported as a crash by the next runtime tool call.
+    """
+    _runtime_state["seen"] = False
 
 
 async def _get_crash_diagnostics() -> str:
@@ -94,9 +121,7 @@ async def _get_crash_diagnostics() -> str:
         log = await editor.get("/debugger/output")
         output = log.get("output", "")
         if output:
-            for line in output.split("\n"):
-                if line.strip() and _is_error_line(line):
-                    error_lines.append(line.strip())
+            error_lines = _extract_error_lines(output)
     except Exception:
         pass  # Editor may be unreachable too — best effort
 
@@ -132,38 +157,170 @@ async def _get_crash_diagnostics() -> str:
     )
 
 
-async def _check_runtime() -> str | None:
-    """Return an error message if runtime is not available, None if OK.
-
-    Uses a short TTL cache: after a successful check, skip re-checking for a
-    few seconds. This eliminates the double-request overhead on rapid tool
-    sequences while still detecting a stopped game within seconds.
+async def _runtime_unavailable() -> dict[str, Any]:
+    """Build the error result for a runtime request that couldn't connect.
 
     When the game was previously running but is now gone, fetches crash
     diagnostics from the editor bridge so the agent knows *why* it died.
     """
-    now = time.monotonic()
-    if now - _runtime_cache["last_ok"] < _CACHE_TTL:
-        return None
-    if not await runtime.is_available():
-        was_previously_running = _runtime_cache["last_ok"] > 0
-        # Invalidate cache so subsequent calls don't wait for TTL
-        _runtime_cache["last_ok"] = 0.0
-        if was_previously_running:
-            return await _get_crash_diagnostics()
-        return GAME_NOT_RUNNING_MSG
-    _runtime_cache["last_ok"] = now
-    return None
+    if _runtime_state["seen"]:
+        _runtime_state["seen"] = False
+        return {"error": await _get_crash_diagnostics()}
+    return {"error": GAME_NOT_RUNNING_MSG}
+
+
+async def _runtime_get(
+    path: str, params: QueryParams | None = None, timeout: float | None = None,
+) -> dict[str, Any]:
+    """GET from the runtime bridge, mapping a refused connection to an error.
+
+    Tools call the real endpoint directly instead of probing /info first;
+    a stopped or crashed game surfaces as a connect error on that request.
+    """
+    try:
+        result = await runtime.get(path, params, timeout=timeout)
+    except httpx.ConnectError:
+        return await _runtime_unavailable()
+    _runtime_state["seen"] = True
+    return result
+
+
+async def _runtime_post(
+    path: str, json: dict[str, Any] | None = None, timeout: float | None = None,
+) -> dict[str, Any]:
+    """POST to the runtime bridge, mapping a refused connection to an error."""
+    try:
+        result = await runtime.post(path, json, timeout=timeout)
+    except httpx.ConnectError:
+        return await _runtime_unavailable()
+    _runtime_state["seen"] = True
+    return result
+
+
+async def _runtime_batched_post(path: str, json: dict[str, Any]) -> dict[str, Any]:
+    """Like _runtime_post, but coalesced with concurrent input calls.
+
+    Goes through the client's /batch batcher, so parallel input tool calls
+    (click, key, action, mouse move) share one round trip and still reach
+    the game in the order they were issued.
+    """
+    try:
+        result = await runtime.batched_post(path, json)
+    except httpx.ConnectError:
+        return await _runtime_unavailable()
+    _runtime_state["seen"] = True
+    return result
+
+
+async def _runtime_post_raw(path: str, content: bytes) -> dict[str, Any]:
+    """Like _runtime_post, for a body pre-encoded with pack_json()."""
+    try:
+        result = await runtime.post_raw(path, content)
+    except httpx.ConnectError:
+        return await _runtime_unavailable()
+    _runtime_state["seen"] = True
+    return result
+
+
+# Read-only observations game_input_sequence can fetch once the sequence is
+# done, by name -> runtime endpoint.
+_OBSERVATIONS: dict[str, str] = {
+    "console": "/console",
+    "events": "/events",
+    "info": "/info",
+    "actions": "/actions",
+}
+
+
+async def _gather_observations(names: list[str]) -> dict[str, Any]:
+    """Fetch the named observations concurrently over the shared pool."""
+    wanted = [n for n in dict.fromkeys(names) if n in _OBSERVATIONS]
+    results = await asyncio.gather(*(_runtime_get(_OBSERVATIONS[n]) for n in wanted))
+    observations: dict[str, Any] = dict(zip(wanted, results))
+    for name in names:
+        if name not in _OBSERVATIONS:
+            observations[name] = {"error": f"Unknown observation '{name}' — use one of: {', '.join(_OBSERVATIONS)}"}
+    return observations
+
+
+async def _pack_result(summary: str, data: dict[str, Any]) -> list[Any]:
+    """Build a [summary, data, image?] tool result, moving any screenshot out of data.
+
+    The screenshot is either top-level or inside a nested "snapshot" dict
+    (/wait_for). When present it is also pushed to the editor's vision panel.
+    """
+    nested = data.get("snapshot")
+    holder = nested if isinstance(nested, dict) else data
+    screenshot = holder.pop("screenshot", None)
+    result: list[Any] = [summary, data]
+    if screenshot and isinstance(screenshot, str):
+        result.append(_b64_image(screenshot))
+        await _push_vision(screenshot, holder)
+    return result
+
+
+@lru_cache(maxsize=32)
+def _depth_params(depth: int) -> tuple[tuple[str, str], ...]:
+    """Query params for endpoints that only take a depth, built once per depth.
+
+    A tuple of pairs rather than a dict, so the shared instance can't be
+    mutated by a caller.
+    """
+    return (("depth", str(depth)),)
+
+
+def _node_body(base: dict[str, Any] | None = None, **optional: Any) -> dict[str, Any]:
+    """Build a request body (or query params), adding only the optional fields that are set.
+
+    For node-targeting fields like ref/path, an empty string or None means
+    "not given", so those are left out instead of being sent as blanks.
+    """
+    body: dict[str, Any] = {} if base is None else base
+    body.update({k: v for k, v in optional.items() if v != "" and v is not None})
+    return body
+
+
+def _step_delay(step: dict[str, Any]) -> float:
+    """Seconds an input sequence step takes: its wait, or its hold duration.
+
+    Each step has one key determining its action, so at most one of the two
+    applies.
+    """
+    if "wait" in step:
+        return step["wait"]
+    return step.get("duration", 0)
 
 
 def _count_nodes(nodes: list[dict]) -> int:
-    """Count total nodes in a nested snapshot tree."""
-    count = len(nodes)
-    for node in nodes:
-        count += _count_nodes(node.get("children", []))
+    """Count total nodes in a nested snapshot tree.
+
+    Walks with an explicit stack so deeply nested UIs don't pay a Python
+    frame per node or hit the recursion limit.
+    """
+    count = 0
+    stack = [nodes]
+    while stack:
+        level = stack.pop()
+        count += len(level)
+        for node in level:
+            children = node.get("children")
+            if children:
+                stack.append(children)
     return count
 
 
+def _snapshot_node_count(data: dict[str, Any]) -> int:
+    """Node count of a /snapshot payload.
+
+    The bridge already counts while building its description and reports it
+    as ``node_count``; only older bridges need the Python-side walk.
+    """
+    node_count = data.get("node_count")
+    if node_count is None:
+        node_count = _count_nodes(data.get("nodes", []))
+    return node_count
+
+
 def register_runtime_tools(mcp: FastMCP) -> None:
     """Register all runtime tools with the MCP server."""
 
@@ -176,6 +333,10 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         include_screenshot: bool = False,
         annotate: bool = True,
         quality: float = 0.75,
+        with_diff: bool = False,
+        with_history: bool = False,
+        fields: list[str] | None = None,
+        include_state: list[str] | None = None,
     ) -> list[Any]:
         """Get a structured scene tree snapshot from the running game with stable refs.
 
@@ -194,6 +355,7 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         IMPORTANT — Keep snapshots lean to conserve context:
         - Use root to focus on a subtree: root='Player' or root='HUD'
         - Use depth=3 or depth=4 instead of the full tree when you only need nearby nodes
+        - Use fields=['type', 'name'] when you only need the structure, not positions/properties
         - Use game_snapshot_diff() after actions to see only what changed
         - Use game_state(ref='n5') to deep-inspect one node instead of snapshotting everything
         - First snapshot can be full (depth=12). Follow-ups should be targeted.
@@ -205,11 +367,19 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             annotate: Draw ref labels on screenshot (default True). Only applies when
                 include_screenshot=True.
             quality: JPEG quality 0.0–1.0 (default 0.75). Lower = smaller response.
+            with_diff: Also return game_snapshot_diff's changes since the previous
+                diff call (default False). Fetched concurrently with the snapshot;
+                refs from this snapshot stay valid.
+            with_history: Also return game_scene_history's events (default False).
+                Fetched concurrently with the snapshot.
+            fields: Per-node keys to return, e.g. ['type', 'name'] or
+                ['type', 'global_position']. 'ref' and 'children' are always included.
+                Available: name, type, path, visible, position, global_position,
+                rotation, scale, size, text, groups, properties. Default = all.
+            include_state: Node paths (or refs as numbered by this snapshot) to also
+                return game_state details for, under "states" — saves separate
+                game_state calls.
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
-
         params: dict[str, str] = {
             "depth": str(depth),
             "include_screenshot": "true" if include_screenshot else "false",
@@ -218,26 +388,40 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         }
         if root:
             params["root"] = root
-
-        data = await runtime.get("/snapshot", params)
+        if fields:
+            params["fields"] = ",".join(fields)
+        if include_state:
+            params["state"] = ",".join(include_state)
+
+        requests = [_runtime_get("/snapshot", params)]
+        if with_diff:
+            # keep_refs: the diff walks with its own ref numbering on the
+            # bridge, so it can't clobber this snapshot's refs mid-flight.
+            requests.append(_runtime_get("/snapshot/diff", _depth_params(depth) + (("keep_refs", "true"),)))
+        if with_history:
+            requests.append(_runtime_get("/scene_history"))
+        data, *extras = await asyncio.gather(*requests)
         if "error" in data:
             return [str(data["error"])]
 
         # Build human-readable summary for the user
-        screenshot_data = data.pop("screenshot", None)
         scene = data.get("scene_name", "unknown")
-        node_count = _count_nodes(data.get("nodes", []))
+        node_count = _snapshot_node_count(data)
         fps = data.get("fps", "?")
         paused = " (PAUSED)" if data.get("paused") else ""
         pending = data.get("pending_events", 0)
         events_hint = f", {pending} pending event(s)" if pending > 0 else ""
         summary = f"📷 Snapshot of '{scene}' — {node_count} nodes, {fps} FPS{paused}, frame {data.get('frame', '?')}{events_hint}"
 
-        result: list[Any] = [summary, data]
+        result = await _pack_result(summary, data)
 
-        if screenshot_data:
-            result.append(_b64_image(screenshot_data))
-            await _push_vision(screenshot_data, data)
+        # Extra observations go between the data and the image
+        if with_history:
+            history = extras.pop()
+            result.insert(2, {"scene_history": history.get("error") or history.get("events", [])})
+        if with_diff:
+            diff = extras.pop()
+            result.insert(2, {"snapshot_diff": diff.get("error") or diff.get("diff")})
 
         # Check for developer director notes
         director_notes = await _fetch_director_notes()
@@ -254,6 +438,7 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         height: int = 360,
         quality: float = 0.75,
         annotate: bool = True,
+        format: str = "jpeg",
     ) -> list[Any]:
         """Capture the running game viewport as a screenshot.
 
@@ -269,16 +454,15 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             height: Screenshot height in pixels (default 360).
             quality: JPEG quality 0.0–1.0 (default 0.75). Lower = smaller response.
             annotate: Draw ref labels on the screenshot (default True).
+            format: "jpeg" (default) or "webp". WebP is usually noticeably smaller
+                at the same quality.
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
-
-        data = await runtime.get("/screenshot", {
+        data = await _runtime_get("/screenshot", {
             "width": str(width),
             "height": str(height),
             "quality": str(quality),
             "annotate": "true" if annotate else "false",
+            "format": format,
         })
         if "error" in data:
             return [str(data["error"])]
@@ -287,7 +471,7 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         await _push_vision(image_data)
         result: list[Any] = [
             f"Game screenshot ({data['size'][0]}x{data['size'][1]}, frame {data.get('frame', '?')})",
-            _b64_image(image_data),
+            _b64_image(image_data, data.get("mime", "image/jpeg")),
         ]
 
         # Check for developer director notes
@@ -317,21 +501,13 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             height: Screenshot height in pixels (default 360).
             quality: JPEG quality 0.0–1.0 (default 0.75).
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
-
-        params: dict[str, str] = {
+        params = _node_body({
             "width": str(width),
             "height": str(height),
             "quality": str(quality),
-        }
-        if ref:
-            params["ref"] = ref
-        if path:
-            params["path"] = path
+        }, ref=ref, path=path)
 
-        data = await runtime.get("/screenshot/node", params)
+        data = await _runtime_get("/screenshot/node", params)
         if "error" in data:
             return [str(data["error"])]
 
@@ -355,15 +531,11 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             button: Mouse button — 'left', 'right', or 'middle'.
             double: If True, send a double-click instead of a single click.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
         body: dict[str, Any] = {"x": x, "y": y, "button": button}
         if double:
             body["double"] = True
-        result = await runtime.post("/click", body)
-        if "_description" not in result:
+        result = await _runtime_batched_post("/click", body)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             click_type = "Double-clicked" if double else "Clicked"
             result["_description"] = f"🖱️ {click_type} {button} at ({x:.0f}, {y:.0f})"
         return result
@@ -379,17 +551,9 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             ref: Node ref from latest snapshot (e.g., 'n5'). Preferred.
             path: Node path as alternative (e.g., 'HUD/StartButton').
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        body: dict[str, Any] = {}
-        if ref:
-            body["ref"] = ref
-        if path:
-            body["path"] = path
-        result = await runtime.post("/click_node", body)
-        if "_description" not in result:
+        body = _node_body(ref=ref, path=path)
+        result = await _runtime_batched_post("/click_node", body)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             target = ref or path
             result["_description"] = f"🖱️ Clicked node '{target}'"
         return result
@@ -410,12 +574,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
                     'release' (let go), 'hold' (press for duration then release).
             duration: Seconds to hold the key (only used with action='hold').
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/key", {"key": key, "action": action, "duration": duration})
-        if "_description" not in result:
+        result = await _runtime_batched_post("/key", {"key": key, "action": action, "duration": duration})
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             if action == "hold" and duration > 0:
                 result["_description"] = f"⌨️ Held '{key}' for {duration}s"
             elif action == "tap":
@@ -440,12 +600,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             pressed: True to press, False to release.
             strength: Action strength from 0.0 to 1.0 (for analog input).
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/action", {"action": action, "pressed": pressed, "strength": strength})
-        if "_description" not in result:
+        result = await _runtime_batched_post("/action", {"action": action, "pressed": pressed, "strength": strength})
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             state = "pressed" if pressed else "released"
             result["_description"] = f"🎮 Action '{action}' {state}"
         return result
@@ -465,17 +621,13 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             relative_x: Relative X motion (for FPS-style mouse look). Added on top of absolute position.
             relative_y: Relative Y motion (for FPS-style mouse look). Added on top of absolute position.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
         body: dict[str, Any] = {"x": x, "y": y}
         if relative_x != 0.0:
             body["relative_x"] = relative_x
         if relative_y != 0.0:
             body["relative_y"] = relative_y
-        result = await runtime.post("/mouse_move", body)
-        if "_description" not in result:
+        result = await _runtime_batched_post("/mouse_move", body)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             result["_description"] = f"🖱️ Mouse moved to ({x:.0f}, {y:.0f})"
         return result
 
@@ -484,6 +636,7 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         steps: list[dict[str, Any]],
         snapshot_after: bool = True,
         screenshot_after: bool = False,
+        observations: list[str] | None = None,
     ) -> list[Any]:
         """Execute a sequence of input steps with proper timing.
 
@@ -504,17 +657,14 @@ def register_runtime_tools(mcp: FastMCP) -> None:
                    what you observe in the game, not from a static script.
             snapshot_after: Take a snapshot after the sequence (default True).
             screenshot_after: Include screenshot in the post-sequence snapshot (default False).
+            observations: Extra things to fetch after the sequence, concurrently:
+                          any of "console", "events", "info", "actions". Saves
+                          separate game_console_output / game_events calls.
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
-
         # Estimate total duration from wait/hold steps for timeout
-        total_duration = sum(
-            step.get("wait", 0) + step.get("duration", 0) for step in steps
-        )
+        total_duration = sum(map(_step_delay, steps))
         http_timeout = max(30.0, total_duration + 15.0)
-        data = await runtime.post("/sequence", {
+        data = await _runtime_post("/sequence", {
             "steps": steps,
             "snapshot_after": snapshot_after,
             "screenshot_after": screenshot_after,
@@ -523,13 +673,10 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         if "error" in data:
             return [str(data["error"])]
 
-        screenshot_data = data.pop("screenshot", None)
-        summary = f"🎮 Executed {len(steps)}-step input sequence"
-        result: list[Any] = [summary, data]
-        if screenshot_data:
-            result.append(_b64_image(screenshot_data))
-            await _push_vision(screenshot_data, data)
-        return result
+        if observations:
+            data["observations"] = await _gather_observations(observations)
+
+        return await _pack_result(f"🎮 Executed {len(steps)}-step input sequence", data)
 
     # --- State ---
 
@@ -550,17 +697,9 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             ref: Node ref from latest snapshot (e.g., 'n1'). Preferred.
             path: Node path as alternative (e.g., 'Player').
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        params: dict[str, str] = {}
-        if ref:
-            params["ref"] = ref
-        if path:
-            params["path"] = path
-        result = await runtime.get("/state", params)
-        if "error" not in result and "_description" not in result:
+        params = _node_body(ref=ref, path=path)
+        result = await _runtime_get("/state", params)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             target = ref or path
             node_type = result.get("type", "?")
             result["_description"] = f"🔍 State of '{target}' ({node_type})"
@@ -583,19 +722,9 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             path: Node path as alternative.
             args: List of arguments to pass to the method.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        body: dict[str, Any] = {"method": method}
-        if ref:
-            body["ref"] = ref
-        if path:
-            body["path"] = path
-        if args is not None:
-            body["args"] = args
-        result = await runtime.post("/call_method", body)
-        if "_description" not in result:
+        body = _node_body({"method": method}, ref=ref, path=path, args=args)
+        result = await _runtime_post("/call_method", body)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             target = ref or path
             result["_description"] = f"📞 Called '{target}'.{method}()"
         return result
@@ -623,17 +752,9 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             ref: Node ref from latest snapshot. Preferred.
             path: Node path as alternative.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        body: dict[str, Any] = {"property": property, "value": value}
-        if ref:
-            body["ref"] = ref
-        if path:
-            body["path"] = path
-        result = await runtime.post("/set_property", body)
-        if "ok" in result and "_description" not in result:
+        body = _node_body({"property": property, "value": value}, ref=ref, path=path)
+        result = await _runtime_post("/set_property", body)
+        if _DESCRIBE and "ok" in result and "_description" not in result:
             target = ref or path
             result["_description"] = f"✏️ Set '{target}'.{property}"
         return result
@@ -656,13 +777,15 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             snapshot: Whether to take a snapshot after waiting (default True).
             screenshot: Whether to include a screenshot (default False).
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
+        # Nothing to wait for and nothing to return — skip the round trip.
+        # Positive waits still go to the game: its timer runs in game time
+        # (time scale, pause), which a local sleep wouldn't match.
+        if seconds <= 0 and not snapshot and not screenshot:
+            return ["⏱️ Waited 0s", {"waited": 0.0}]
 
         # Use a generous timeout: wait duration + 15s headroom for snapshot
         http_timeout = seconds + 15.0
-        data = await runtime.post("/wait", {
+        data = await _runtime_post("/wait", {
             "seconds": seconds,
             "snapshot": snapshot,
             "screenshot": screenshot,
@@ -671,13 +794,7 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         if "error" in data:
             return [str(data["error"])]
 
-        screenshot_data = data.pop("screenshot", None)
-        summary = f"⏱️ Waited {seconds}s"
-        result: list[Any] = [summary, data]
-        if screenshot_data and isinstance(screenshot_data, str):
-            result.append(_b64_image(screenshot_data))
-            await _push_vision(screenshot_data, data)
-        return result
+        return await _pack_result(f"⏱️ Waited {seconds}s", data)
 
     @mcp.tool
     async def game_wait_for(
@@ -714,50 +831,27 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             snapshot: Take snapshot after condition met (default True).
             screenshot: Include screenshot (default False).
         """
-        err = await _check_runtime()
-        if err:
-            return [err]
-
-        body: dict[str, Any] = {
+        body = _node_body({
             "condition": condition,
             "timeout": timeout,
             "poll_interval": poll_interval,
             "snapshot": snapshot,
             "screenshot": screenshot,
-        }
-        if ref:
-            body["ref"] = ref
-        if path:
-            body["path"] = path
-        if property:
-            body["property"] = property
+        }, ref=ref, path=path, property=property, signal=signal_name)
+        # value may legitimately be "" (e.g. waiting for a label to clear)
         if value is not None:
             body["value"] = value
-        if signal_name:
-            body["signal"] = signal_name
 
         http_timeout = timeout + 15.0
-        data = await runtime.post("/wait_for", body, timeout=http_timeout)
+        data = await _runtime_post("/wait_for", body, timeout=http_timeout)
 
         if "error" in data:
             return [str(data["error"])]
 
-        # Extract screenshot from nested snapshot if present
-        screenshot_data = None
-        if "snapshot" in data and isinstance(data["snapshot"], dict):
-            screenshot_data = data["snapshot"].pop("screenshot", None)
-        elif "screenshot" in data:
-            screenshot_data = data.pop("screenshot", None)
-
         met = data.get("condition_met", False)
         elapsed = data.get("elapsed", "?")
         status = "✅ met" if met else "⏳ timed out"
-        summary = f"⏱️ wait_for '{condition}' — {status} after {elapsed}s"
-        result: list[Any] = [summary, data]
-        if screenshot_data and isinstance(screenshot_data, str):
-            result.append(_b64_image(screenshot_data))
-            await _push_vision(screenshot_data, data.get("snapshot") if isinstance(data.get("snapshot"), dict) else data)
-        return result
+        return await _pack_result(f"⏱️ wait_for '{condition}' — {status} after {elapsed}s", data)
 
     # --- Game Control ---
 
@@ -775,12 +869,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Args:
             paused: True to pause, False to unpause.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/pause", {"paused": paused})
-        if "_description" not in result:
+        result = await _runtime_post_raw("/pause", pack_json(paused=paused))
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             state = "⏸️ Game PAUSED" if paused else "▶️ Game RESUMED"
             result["_description"] = state
         return result
@@ -802,12 +892,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Args:
             scale: Time multiplier (clamped to 0.01–10.0). Default 1.0.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/timescale", {"scale": scale})
-        if "_description" not in result:
+        result = await _runtime_post_raw("/timescale", pack_json(scale=scale))
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             result["_description"] = f"⏩ Time scale set to {scale}x"
         return result
 
@@ -823,12 +909,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Invaluable for debugging runtime issues, seeing print() debug output,
         and catching errors that occur during gameplay.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/console")
-        if "_description" not in result:
+        result = await _runtime_get("/console")
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             lines = len(result.get("output", "").split("\n")) if result.get("output") else 0
             result["_description"] = f"📟 Console output ({lines} lines)"
         return result
@@ -852,17 +934,14 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Args:
             depth: Max tree depth to walk (default 12).
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/snapshot/diff", {"depth": str(depth)})
-        if "error" not in result and "_description" not in result:
+        result = await _runtime_get("/snapshot/diff", _depth_params(depth))
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             diff = result.get("diff", {})
-            added = len(diff.get("nodes_added", []))
-            removed = len(diff.get("nodes_removed", []))
-            changed = len(diff.get("nodes_changed", {}))
-            result["_description"] = f"📊 Snapshot diff — {added} added, {removed} removed, {changed} changed"
+            result["_description"] = _DIFF_DESC.format(
+                len(diff.get("nodes_added", ())),
+                len(diff.get("nodes_removed", ())),
+                len(diff.get("nodes_changed", ())),
+            )
         return result
 
     # --- Scene History ---
@@ -875,12 +954,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         scene tree was modified (nodes added/removed/moved). Useful for
         understanding what happened during a sequence of actions.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/scene_history")
-        if "error" not in result and "_description" not in result:
+        result = await _runtime_get("/scene_history")
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             count = len(result.get("events", []))
             result["_description"] = f"📜 Scene history — {count} event(s)"
         return result
@@ -894,12 +969,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Returns project name, current scene, viewport size, FPS, available actions,
         autoloads, pause state, and more. Useful for orientation.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/info")
-        if "_description" not in result:
+        result = await _runtime_get("/info")
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             scene = result.get("current_scene", "?")
             result["_description"] = f"ℹ️ Game info — scene '{scene}'"
         return result
@@ -910,12 +981,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
 
         Use this to see what actions you can trigger with game_trigger_action.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/actions")
-        if "error" not in result and "_description" not in result:
+        result = await _runtime_get("/actions")
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             count = len(result.get("actions", {}))
             result["_description"] = f"🎮 {count} input action(s) available"
         return result
@@ -952,18 +1019,12 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Args:
             peek: If True, read events without clearing them (default False).
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        params: dict[str, str] = {}
-        if peek:
-            params["peek"] = "true"
-        result = await runtime.get("/events", params)
-        if "error" not in result and "_description" not in result:
-            count = len(result.get("events", []))
-            mode = " (peek)" if peek else ""
-            result["_description"] = f"📨 {count} game event(s){mode}"
+        params = _EVENTS_PEEK if peek else _EVENTS_NOPEEK
+        result = await _runtime_get("/events", params)
+        if _DESCRIBE and "error" not in result and "_description" not in result:
+            result["_description"] = _EVENTS_DESC.format(
+                len(result.get("events", ())), " (peek)" if peek else "",
+            )
         return result
 
     @mcp.tool
@@ -985,16 +1046,12 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             property: Property name to watch (e.g., 'health', 'score', 'text', 'visible').
             label: Human-readable label for the watch (e.g., 'player_health'). Auto-generated if empty.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/events/watch", {
+        result = await _runtime_post("/events/watch", {
             "node_path": node_path,
             "property": property,
             "label": label,
         })
-        if "_description" not in result:
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             result["_description"] = f"👁️ Watching '{node_path}.{property}'"
         return result
 
@@ -1006,15 +1063,11 @@ def register_runtime_tools(mcp: FastMCP) -> None:
             node_path: Path to the node (must match what was passed to game_add_watch).
             property: Property name (must match what was passed to game_add_watch).
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.post("/events/unwatch", {
+        result = await _runtime_post("/events/unwatch", {
             "node_path": node_path,
             "property": property,
         })
-        if "_description" not in result:
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             result["_description"] = f"👁️ Unwatched '{node_path}.{property}'"
         return result
 
@@ -1025,12 +1078,8 @@ def register_runtime_tools(mcp: FastMCP) -> None:
         Shows which properties are being monitored for changes, along with
         their current (last seen) values.
         """
-        err = await _check_runtime()
-        if err:
-            return {"error": err}
-
-        result = await runtime.get("/events/watches")
-        if "error" not in result and "_description" not in result:
+        result = await _runtime_get("/events/watches")
+        if _DESCRIBE and "error" not in result and "_description" not in result:
             count = len(result.get("watches", []))
             result["_description"] = f"👁️ {count} active watch(es)"
         return result
@@ -20,17 +20,33 @@ from __future__ import annotations
 
 import sys
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-# Ensure the mcp_server directory is on the path for local imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Ensure the mcp_server directory is on the path for local imports.
+# __file__ is already absolute for the main module (Python 3.9+), so no
+# abspath() round-trip through getcwd is needed.
+sys.path.insert(0, os.path.dirname(__file__))
 
 from fastmcp import FastMCP
 from editor_tools import register_editor_tools
 from runtime_tools import register_runtime_tools
+import client
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Close the pooled HTTP client to the Godot bridges on shutdown."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
 
 # Create the MCP server
 mcp = FastMCP(
     "godot-ai-bridge",
+    lifespan=_lifespan,
     instructions=(
         "You have access to tools for controlling the Godot game engine. "
         "Editor tools (godot_*) control the Godot Editor — editing scenes, "
@@ -123,4 +139,11 @@ register_editor_tools(mcp)
 register_runtime_tools(mcp)
 
 if __name__ == "__main__":
+    # Every tool is an HTTP round trip to Godot, so event-loop overhead sits on
+    # each call's latency; use uvloop's libuv-backed loop when it's installed.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     mcp.run()
@@ -43,6 +43,9 @@ func _ready() -> void:
 	register_route("POST", "/events/unwatch", _on_remove_watch)
 	register_route("GET", "/events/watches", _on_get_watches)
 
+	# Batched requests (several routed ops in one HTTP round trip)
+	register_route("POST", "/batch", handle_batch)
+
 	var err: Error = start(BridgeConfig.RUNTIME_PORT)
 	if err == OK:
 		print("[Godot AI Bridge] Runtime bridge listening on port %d" % BridgeConfig.RUNTIME_PORT)
@@ -4,6 +4,9 @@ class_name RuntimeRoutes
 extends RefCounted
 
 var _snapshot: RuntimeSnapshot
+## Separate walker for /snapshot/diff?keep_refs=true, so a diff taken
+## alongside a snapshot doesn't renumber the refs the agent was just given.
+var _diff_walker: RuntimeSnapshot
 var _injector: InputInjector
 var _tree: SceneTree
 var _previous_snapshot: Dictionary = {}
@@ -15,6 +18,7 @@ var _accumulator: EventAccumulator
 func _init(tree: SceneTree) -> void:
 	_tree = tree
 	_snapshot = RuntimeSnapshot.new()
+	_diff_walker = RuntimeSnapshot.new()
 	_injector = InputInjector.new(tree)
 	_accumulator = EventAccumulator.new(tree)
 	_accumulator.start()
@@ -51,6 +55,10 @@ func handle_snapshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var include_screenshot: bool = request.query_params.get("include_screenshot", "false") == "true"
 	var annotate: bool = request.query_params.get("annotate", "false") == "true"
 	var quality: float = float(request.query_params.get("quality", str(BridgeConfig.DEFAULT_SCREENSHOT_QUALITY)))
+	var fields: PackedStringArray = str(request.query_params.get("fields", "")).split(",", false)
+	if not fields.is_empty() and include_screenshot and annotate:
+		# RuntimeAnnotation reads these to pick and skip nodes
+		fields.append_array(PackedStringArray(["type", "visible", "text", "properties"]))
 
 	var target: Node = root
 	if custom_root != "":
@@ -60,7 +68,17 @@ func handle_snapshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 		else:
 			return {"error": "Root node not found: %s" % custom_root}
 
-	var result: Dictionary = _snapshot.take_snapshot(target, depth)
+	var result: Dictionary = _snapshot.take_snapshot(target, depth, fields)
+
+	# Detailed state for selected nodes, saving separate /state round trips.
+	# Resolved after the walk, so refs refer to this snapshot's numbering.
+	var state_keys: PackedStringArray = str(request.query_params.get("state", "")).split(",", false)
+	if not state_keys.is_empty():
+		var states: Dictionary = {}
+		for key: String in state_keys:
+			var node: Node = _snapshot.resolve_ref(key, root)
+			states[key] = StateReader.read_state(node) if node != null else {"error": "Node not found: %s" % key}
+		result["states"] = states
 
 	if include_screenshot:
 		var viewport: Viewport = _tree.root
@@ -93,6 +111,7 @@ func handle_snapshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 
 	var scene_name: String = result.get("scene_name", "unknown")
 	var node_count: int = _count_snapshot_nodes(result.get("nodes", []))
+	result["node_count"] = node_count
 	var fps: String = str(result.get("fps", "?"))
 	var paused_str: String = " (PAUSED)" if result.get("paused", false) else ""
 	var events_str: String = ", %d pending event(s)" % pending_events if pending_events > 0 else ""
@@ -107,6 +126,7 @@ func handle_screenshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 	var height: int = int(request.query_params.get("height", str(BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT)))
 	var quality: float = float(request.query_params.get("quality", str(BridgeConfig.DEFAULT_SCREENSHOT_QUALITY)))
 	var annotate: bool = request.query_params.get("annotate", "false") == "true"
+	var format: String = request.query_params.get("format", "jpeg")
 	var viewport: Viewport = _tree.root
 
 	await _tree.process_frame
@@ -125,9 +145,9 @@ func handle_screenshot(request: BridgeHTTPServer.BridgeRequest) -> Dictionary:
 				snap_data.get("nodes", []), _snapshot, root, viewport
 			)
 			raw_image = await RuntimeAnnotation.annotate(raw_image, annotations, _tree)
-		result = RuntimeScreenshot.encode(raw_image, width, height, quality)
+		result = RuntimeScreenshot.encode(raw_image, width, height, quality, format)
 	else:
-		result = RuntimeScreenshot.capture(viewport, width, height, quality)
+		result = RuntimeScreenshot.capture(viewport, width, height, quality, format)
 
 	if not result.has("error"):
 		var size: Array = result.get("size", [width, height])
@@ -639,9 +659,12 @@ func handle_snapshot_diff(request: BridgeHTTPServer.BridgeRequest) -> Dictionary
 		return {"error": "No active scene"}
 
 	var depth: int = int(request.query_params.get("depth", str(BridgeConfig.MAX_SNAPSHOT_DEPTH)))
+	# Diffs are keyed by node path, so the walk can use its own ref numbering
+	var keep_refs: bool = request.query_params.get("keep_refs", "false") == "true"
+	var walker: RuntimeSnapshot = _diff_walker if keep_refs else _snapshot
 
 	# Take current snapshot
-	var current: Dictionary = _snapshot.take_snapshot(root, depth)
+	var current: Dictionary = walker.take_snapshot(root, depth)
 
 	if _previous_snapshot.is_empty():
 		_previous_snapshot = current
@@ -10,19 +10,19 @@ static func capture_raw(viewport: Viewport) -> Image:
 	return image
 
 
-## Resize and encode an Image as a base64 JPEG result dictionary.
-static func encode(image: Image, width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY) -> Dictionary:
+## Resize and encode an Image as a base64 JPEG (or WebP) result dictionary.
+static func encode(image: Image, width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY, format: String = "jpeg") -> Dictionary:
 	if image == null:
 		return {"error": "No image to encode"}
 
 	if width > 0 and height > 0:
 		image.resize(width, height, Image.INTERPOLATE_LANCZOS)
 
-	var base64: String = _encode_jpeg_with_budget(image, quality)
+	var base64: String = _encode_with_budget(image, quality, format)
 
 	return {
 		"image": base64,
-		"mime": "image/jpeg",
+		"mime": mime_type(format),
 		"size": [image.get_width(), image.get_height()],
 		"context": "runtime",
 		"frame": Engine.get_frames_drawn(),
@@ -30,13 +30,13 @@ static func encode(image: Image, width: int = BridgeConfig.DEFAULT_SCREENSHOT_WI
 	}
 
 
-## Capture the running game viewport and return as base64 JPEG.
+## Capture the running game viewport and return as base64 JPEG (or WebP).
 ## Convenience wrapper that combines capture_raw + encode.
-static func capture(viewport: Viewport, width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY) -> Dictionary:
+static func capture(viewport: Viewport, width: int = BridgeConfig.DEFAULT_SCREENSHOT_WIDTH, height: int = BridgeConfig.DEFAULT_SCREENSHOT_HEIGHT, quality: float = BridgeConfig.DEFAULT_SCREENSHOT_QUALITY, format: String = "jpeg") -> Dictionary:
 	var image: Image = capture_raw(viewport)
 	if image == null:
 		return {"error": "Failed to capture viewport image"}
-	return encode(image, width, height, quality)
+	return encode(image, width, height, quality, format)
 
 
 ## Capture a region of the viewport around a specific node.
@@ -64,7 +64,7 @@ static func capture_node(node: Node, viewport: Viewport, width: int = 0, height:
 	if width > 0 and height > 0:
 		cropped.resize(width, height, Image.INTERPOLATE_LANCZOS)
 
-	var base64: String = _encode_jpeg_with_budget(cropped, quality)
+	var base64: String = _encode_with_budget(cropped, quality, "jpeg")
 
 	return {
 		"image": base64,
@@ -77,15 +77,27 @@ static func capture_node(node: Node, viewport: Viewport, width: int = 0, height:
 	}
 
 
-## Encode an image as JPEG base64, reducing quality if the result exceeds the size budget.
-static func _encode_jpeg_with_budget(image: Image, quality: float) -> String:
-	var buffer: PackedByteArray = image.save_jpg_to_buffer(quality)
+## MIME type for a screenshot format ("webp" or anything else = JPEG).
+static func mime_type(format: String) -> String:
+	return "image/webp" if format == "webp" else "image/jpeg"
+
+
+## Encode an image as lossy JPEG or WebP bytes at the given quality.
+static func _save_to_buffer(image: Image, quality: float, format: String) -> PackedByteArray:
+	if format == "webp":
+		return image.save_webp_to_buffer(true, quality)
+	return image.save_jpg_to_buffer(quality)
+
+
+## Encode an image as base64, reducing quality if the result exceeds the size budget.
+static func _encode_with_budget(image: Image, quality: float, format: String) -> String:
+	var buffer: PackedByteArray = _save_to_buffer(image, quality, format)
 	var base64: String = Marshalls.raw_to_base64(buffer)
 
 	# If over budget, re-encode at progressively lower quality
 	var q: float = quality - 0.15
 	while base64.length() > BridgeConfig.MAX_BASE64_LENGTH and q >= 0.2:
-		buffer = image.save_jpg_to_buffer(q)
+		buffer = _save_to_buffer(image, q, format)
 		base64 = Marshalls.raw_to_base64(buffer)
 		q -= 0.15
 
@@ -6,12 +6,19 @@ extends RefCounted
 ## Maps ref string (e.g. "n1") to NodePath for the current snapshot.
 var ref_map: Dictionary = {}
 var _ref_counter: int = 0
+## Per-node keys requested for the current snapshot (empty = all of them).
+var _fields: Dictionary = {}
 
 
 ## Take a full snapshot of the scene tree.
-func take_snapshot(root: Node, max_depth: int = BridgeConfig.MAX_SNAPSHOT_DEPTH) -> Dictionary:
+## fields: optional per-node keys to keep (e.g. ["type", "name"]); "ref" and
+## "children" are always included. Empty = every key.
+func take_snapshot(root: Node, max_depth: int = BridgeConfig.MAX_SNAPSHOT_DEPTH, fields: PackedStringArray = PackedStringArray()) -> Dictionary:
 	ref_map.clear()
 	_ref_counter = 0
+	_fields.clear()
+	for field: String in fields:
+		_fields[field] = true
 
 	var viewport: Viewport = root.get_viewport()
 	var viewport_size: Vector2 = viewport.get_visible_rect().size if viewport else Vector2.ZERO
@@ -89,18 +96,21 @@ func _walk_tree(node: Node, out_nodes: Array, max_depth: int, current_depth: int
 		data["size"] = null
 
 	# Text property for UI elements
-	data["text"] = _get_text_property(node)
+	if _wants("text"):
+		data["text"] = _get_text_property(node)
 
 	# Groups (filter internal ones starting with _)
-	var groups: Array[String] = []
-	for g: StringName in node.get_groups():
-		var gs: String = str(g)
-		if not gs.begins_with("_"):
-			groups.append(gs)
-	data["groups"] = groups
+	if _wants("groups"):
+		var groups: Array[String] = []
+		for g: StringName in node.get_groups():
+			var gs: String = str(g)
+			if not gs.begins_with("_"):
+				groups.append(gs)
+		data["groups"] = groups
 
 	# Script variables (exported / stored)
-	data["properties"] = _get_script_properties(node)
+	if _wants("properties"):
+		data["properties"] = _get_script_properties(node)
 
 	# Children
 	var children: Array = []
@@ -113,10 +123,22 @@ func _walk_tree(node: Node, out_nodes: Array, max_depth: int, current_depth: int
 				break
 
 	data["children"] = children
+
+	# Drop the cheap keys that weren't asked for
+	if not _fields.is_empty():
+		for key: String in data.keys():
+			if key != "ref" and key != "children" and not _fields.has(key):
+				data.erase(key)
+
 	out_nodes.append(data)
 	return node_count
 
 
+## Whether the current snapshot should include the given per-node key.
+func _wants(key: String) -> bool:
+	return _fields.is_empty() or _fields.has(key)
+
+
 ## Generate next ref string.
 func _next_ref() -> String:
 	_ref_counter += 1
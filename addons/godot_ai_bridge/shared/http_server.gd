@@ -13,6 +13,9 @@ class BridgeRequest:
 	var body: String = ""
 	var json_body: Variant = null
 	var raw_complete: bool = false
+	## Whether the client allows the connection to stay open after the response
+	## (HTTP/1.1 without "Connection: close").
+	var keep_alive: bool = false
 
 ## Active client connection being accumulated.
 class ClientConnection:
@@ -22,6 +25,8 @@ class ClientConnection:
 	var headers_parsed: bool = false
 	var content_length: int = 0
 	var header_end_index: int = -1
+	## Number of buffer bytes belonging to the current request (headers + body).
+	var consumed_bytes: int = 0
 	var created_at: float = 0.0
 
 	func _init(p_peer: StreamPeerTCP) -> void:
@@ -29,6 +34,17 @@ class ClientConnection:
 		request = BridgeRequest.new()
 		created_at = Time.get_ticks_msec() / 1000.0
 
+	## Prepare a kept-alive connection for its next request. Bytes past the
+	## current request (a pipelined follow-up) are kept in the buffer.
+	func reset_for_next_request() -> void:
+		buffer = buffer.slice(consumed_bytes)
+		request = BridgeRequest.new()
+		headers_parsed = false
+		content_length = 0
+		header_end_index = -1
+		consumed_bytes = 0
+		created_at = Time.get_ticks_msec() / 1000.0
+
 var _tcp_server: TCPServer = null
 var _routes: Dictionary = {}  # "METHOD /path" -> Callable
 var _active_connections: Array[ClientConnection] = []
@@ -70,6 +86,51 @@ func register_route(method: String, path: String, handler: Callable) -> void:
 	_routes[key] = handler
 
 
+## Run several routed requests in one round trip.
+## Body: {"ops": [{"method": "POST", "path": "/node/add", "body": {...}}, ...]}.
+## Ops run sequentially in the given order, so each one sees the effects of the
+## ones before it. Returns {"results": [...]} with one entry per op. Subclasses
+## opt in by registering this as the "POST /batch" route.
+func handle_batch(request: BridgeRequest) -> Dictionary:
+	var body: Dictionary = request.json_body if request.json_body is Dictionary else {}
+	var ops: Variant = body.get("ops", [])
+	if not ops is Array:
+		return {"error": "'ops' must be an array"}
+
+	var results: Array = []
+	for op: Variant in ops:
+		if not op is Dictionary:
+			results.append({"error": "Malformed batch op"})
+			continue
+		var sub := BridgeRequest.new()
+		sub.method = str(op.get("method", "POST")).to_upper()
+		sub.path = str(op.get("path", ""))
+		sub.headers = request.headers
+		sub.json_body = op.get("body", {})
+		sub.body = JSON.stringify(sub.json_body)
+		if op.get("query") is Dictionary:
+			sub.query_params = op["query"]
+		sub.raw_complete = true
+
+		var route_key: String = "%s %s" % [sub.method, sub.path]
+		if sub.path == "/batch" or not _routes.has(route_key):
+			results.append({"error": "Not found", "path": sub.path, "method": sub.method})
+			continue
+
+		var result: Variant = await _routes[route_key].call(sub)
+		var summary: String = ""
+		if result is Dictionary and result.has("_description"):
+			summary = result["_description"]
+		_log_activity(sub.method, sub.path, summary)
+
+		if result is Dictionary or result is Array:
+			results.append(result)
+		else:
+			results.append({"ok": true})
+
+	return {"results": results, "_description": "Batch of %d request(s)" % results.size()}
+
+
 ## Process incoming connections and data each frame.
 func _process(_delta: float) -> void:
 	if _tcp_server == null:
@@ -92,7 +153,7 @@ func _process(_delta: float) -> void:
 	for i: int in range(_active_connections.size()):
 		var conn: ClientConnection = _active_connections[i]
 
-		# Check timeout
+		# Check timeout (refreshed per request on kept-alive connections)
 		if current_time - conn.created_at > CONNECTION_TIMEOUT:
 			_close_connection(conn)
 			to_remove.append(i)
@@ -160,6 +221,7 @@ func _try_parse_request(conn: ClientConnection) -> void:
 
 		conn.request.method = parts[0].to_upper()
 		var full_path: String = parts[1]
+		var http_version: String = parts[2].to_upper() if parts.size() > 2 else "HTTP/1.0"
 
 		# Parse query string
 		var query_idx: int = full_path.find("?")
@@ -184,6 +246,11 @@ func _try_parse_request(conn: ClientConnection) -> void:
 		else:
 			conn.content_length = 0
 
+		# HTTP/1.1 connections are persistent unless the client opts out, which
+		# lets the MCP server's pooled client skip a TCP handshake per tool call.
+		var connection_header: String = conn.request.headers.get("connection", "").to_lower()
+		conn.request.keep_alive = http_version == "HTTP/1.1" and connection_header.find("close") == -1
+
 		conn.headers_parsed = true
 
 	# Check if body is complete — use raw byte count, not string character count,
@@ -198,6 +265,7 @@ func _try_parse_request(conn: ClientConnection) -> void:
 		var body_byte_count: int = conn.buffer.size() - body_byte_start
 
 		if body_byte_count >= conn.content_length:
+			conn.consumed_bytes = body_byte_start + conn.content_length
 			if conn.content_length > 0:
 				var body_slice: PackedByteArray = conn.buffer.slice(body_byte_start, body_byte_start + conn.content_length)
 				conn.request.body = body_slice.get_string_from_utf8()
@@ -247,6 +315,8 @@ func _handle_request(conn: ClientConnection) -> void:
 			_close_connection(conn)
 			return
 
+	var keep_alive: bool = conn.request.keep_alive
+
 	if _routes.has(route_key):
 		var handler: Callable = _routes[route_key]
 		# await works for both sync and async handlers:
@@ -262,24 +332,30 @@ func _handle_request(conn: ClientConnection) -> void:
 		_log_activity(conn.request.method, conn.request.path, summary)
 
 		if result is Dictionary or result is Array:
-			_send_json_response(conn.peer, 200, result)
+			_send_json_response(conn.peer, 200, result, keep_alive)
 		elif result is String:
-			_send_text_response(conn.peer, 200, result)
+			_send_text_response(conn.peer, 200, result, keep_alive)
 		elif result is PackedByteArray:
-			_send_binary_response(conn.peer, 200, result, "application/octet-stream")
+			_send_binary_response(conn.peer, 200, result, "application/octet-stream", keep_alive)
 		elif result == null:
-			_send_json_response(conn.peer, 200, {"ok": true})
+			_send_json_response(conn.peer, 200, {"ok": true}, keep_alive)
 		else:
-			_send_json_response(conn.peer, 200, {"ok": true})
+			_send_json_response(conn.peer, 200, {"ok": true}, keep_alive)
 	else:
 		_log_activity(conn.request.method, conn.request.path)
-		_send_json_response(conn.peer, 404, {"error": "Not found", "path": conn.request.path, "method": conn.request.method})
+		_send_json_response(conn.peer, 404, {"error": "Not found", "path": conn.request.path, "method": conn.request.method}, keep_alive)
 
-	_close_connection(conn)
+	# Hand a persistent connection back to _process() for its next request,
+	# unless the server was stopped while an async handler was running.
+	if keep_alive and _tcp_server != null and conn.peer.get_status() == StreamPeerTCP.STATUS_CONNECTED:
+		conn.reset_for_next_request()
+		_active_connections.append(conn)
+	else:
+		_close_connection(conn)
 
 
 ## Send a JSON response with appropriate headers.
-func _send_json_response(peer: StreamPeerTCP, status_code: int, data: Variant) -> void:
+func _send_json_response(peer: StreamPeerTCP, status_code: int, data: Variant, keep_alive: bool = false) -> void:
 	var json_str: String = JSON.stringify(data)
 	var body_bytes: PackedByteArray = json_str.to_utf8_buffer()
 	var status_text: String = _get_status_text(status_code)
@@ -290,7 +366,7 @@ func _send_json_response(peer: StreamPeerTCP, status_code: int, data: Variant) -
 	header += "Access-Control-Allow-Origin: *\r\n"
 	header += "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
 	header += "Access-Control-Allow-Headers: Content-Type\r\n"
-	header += "Connection: close\r\n"
+	header += "Connection: keep-alive\r\n" if keep_alive else "Connection: close\r\n"
 	header += "\r\n"
 
 	peer.put_data(header.to_utf8_buffer())
@@ -298,7 +374,7 @@ func _send_json_response(peer: StreamPeerTCP, status_code: int, data: Variant) -
 
 
 ## Send a plain text response.
-func _send_text_response(peer: StreamPeerTCP, status_code: int, text: String) -> void:
+func _send_text_response(peer: StreamPeerTCP, status_code: int, text: String, keep_alive: bool = false) -> void:
 	var body_bytes: PackedByteArray = text.to_utf8_buffer()
 	var status_text: String = _get_status_text(status_code)
 
@@ -306,7 +382,7 @@ func _send_text_response(peer: StreamPeerTCP, status_code: int, text: String) ->
 	header += "Content-Type: text/plain; charset=utf-8\r\n"
 	header += "Content-Length: %d\r\n" % body_bytes.size()
 	header += "Access-Control-Allow-Origin: *\r\n"
-	header += "Connection: close\r\n"
+	header += "Connection: keep-alive\r\n" if keep_alive else "Connection: close\r\n"
 	header += "\r\n"
 
 	peer.put_data(header.to_utf8_buffer())
@@ -314,14 +390,14 @@ func _send_text_response(peer: StreamPeerTCP, status_code: int, text: String) ->
 
 
 ## Send a binary response (e.g., raw PNG data).
-func _send_binary_response(peer: StreamPeerTCP, status_code: int, data: PackedByteArray, content_type: String) -> void:
+func _send_binary_response(peer: StreamPeerTCP, status_code: int, data: PackedByteArray, content_type: String, keep_alive: bool = false) -> void:
 	var status_text: String = _get_status_text(status_code)
 
 	var header: String = "HTTP/1.1 %d %s\r\n" % [status_code, status_text]
 	header += "Content-Type: %s\r\n" % content_type
 	header += "Content-Length: %d\r\n" % data.size()
 	header += "Access-Control-Allow-Origin: *\r\n"
-	header += "Connection: close\r\n"
+	header += "Connection: keep-alive\r\n" if keep_alive else "Connection: close\r\n"
 	header += "\r\n"
 
 	peer.put_data(header.to_utf8_buffer())